@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the OptionSettings struct scanner used by the Palworld module.
+
+Builds OptionSettings blocks of increasing size (including quoted strings with
+commas and nested tuples), scans each one and reports the time per field. The
+scanner is linear if the time per field stays flat as the block grows; the
+script exits with a non-zero status if it grows by more than the allowed factor.
+
+Usage:
+    python benchmarks/bench_option_scanner.py [--sizes 1000 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Make the modules package importable when run from anywhere
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.ini_tokenizer import find_struct, scan_struct
+
+# Maximum allowed growth of the per-field time between the smallest and largest block
+MAX_SLOWDOWN = 3.0
+
+
+def build_block(field_count):
+    """Build a PalWorldSettings.ini buffer with field_count OptionSettings fields"""
+    fields = []
+    for i in range(field_count):
+        kind = i % 4
+        if kind == 0:
+            fields.append(f'Rate{i}=1.000000')
+        elif kind == 1:
+            fields.append(f'Description{i}="A server, with (commas) and \\"quotes\\""')
+        elif kind == 2:
+            fields.append(f'Platforms{i}=(Steam,Xbox,PS5,(Mac,Linux))')
+        else:
+            fields.append(f'bEnabled{i}=True')
+    content = (
+        "[/Script/Pal.PalGameWorldSettings]\n"
+        "OptionSettings=(" + ",".join(fields) + ")\n"
+    )
+    return content.encode('utf-8')
+
+
+def time_scan(buffer, repeat):
+    """Return the best scan time in seconds and the number of fields found"""
+    best = None
+    field_count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fields, _end = scan_struct(buffer, find_struct(buffer, 'OptionSettings'))
+        elapsed = time.perf_counter() - started
+        field_count = len(fields)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, field_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'fields':>10} {'bytes':>12} {'seconds':>10} {'us/field':>10}")
+    per_field = []
+    for size in args.sizes:
+        buffer = build_block(size)
+        elapsed, found = time_scan(buffer, args.repeat)
+        if found != size:
+            print(f"Scanner found {found} fields, expected {size}")
+            return 1
+        per_field.append(elapsed / size)
+        print(f"{size:>10} {len(buffer):>12} {elapsed:>10.4f} {elapsed / size * 1e6:>10.3f}")
+
+    slowdown = per_field[-1] / per_field[0]
+    print(f"Per-field time grew by a factor of {slowdown:.2f} (limit {MAX_SLOWDOWN})")
+    return 0 if slowdown <= MAX_SLOWDOWN else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
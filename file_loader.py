@@ -0,0 +1,114 @@
+"""
+Background loading of .ini files.
+
+Reading, detecting and parsing a large file (or one on a slow mount) can take
+long enough to freeze the window. FileLoadWorker runs ModuleLoader.open_file
+on a QThreadPool thread, together with the other per-file preparation that
+doesn't touch widgets (validating the values and building the search and
+section indexes).
+Progress, the result and errors are delivered to the UI thread through the
+signals of FileLoadSignals.
+
+Modules don't need to know about threads: the worker checks for cancellation
+between the loading steps, and ModuleLoader gives every file its own module
+instance, so a cancelled or failed load leaves the open file untouched.
+"""
+
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from modules.module_loader import LoadCancelled
+from modules.search_index import SearchIndex
+from modules.section_index import SectionIndex
+from modules.validation import Validator
+
+
+class LoadedFile:
+    """
+    Everything prepared for an opened file, handed to the UI thread
+    """
+
+    __slots__ = ('file_path', 'game_name', 'module', 'settings_data', 'validator', 'search_index',
+                 'section_index')
+
+    def __init__(self, file_path, game_name, module, settings_data, validator, search_index,
+                 section_index):
+        self.file_path = file_path
+        self.game_name = game_name
+        self.module = module
+        self.settings_data = settings_data
+        self.validator = validator
+        self.search_index = search_index
+        self.section_index = section_index
+
+
+class FileLoadSignals(QObject):
+    """
+    Signals of a FileLoadWorker; they are emitted from the worker thread
+    """
+
+    # (message, percent)
+    progress = pyqtSignal(str, int)
+    # LoadedFile
+    loaded = pyqtSignal(object)
+    # Error message
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class FileLoadWorker(QRunnable):
+    """
+    Loads a file with a ModuleLoader in a thread pool thread
+
+    Args:
+        module_loader (ModuleLoader): Loader used to detect and parse the file
+        file_path (str): Path of the file
+    """
+
+    def __init__(self, module_loader, file_path):
+        super().__init__()
+        self.module_loader = module_loader
+        self.file_path = file_path
+        self.signals = FileLoadSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Stop loading at the next step; cancelled is emitted instead of loaded"""
+        self._cancel.set()
+
+    def is_cancelled(self):
+        """Return True if cancel() was called"""
+        return self._cancel.is_set()
+
+    def _progress(self, message, percent):
+        """Report progress, or stop if the load was cancelled"""
+        if self._cancel.is_set():
+            raise LoadCancelled()
+        self.signals.progress.emit(message, percent)
+
+    def run(self):
+        try:
+            game_name, module, settings_data = self.module_loader.open_file(
+                self.file_path, progress=self._progress)
+
+            self._progress("Validating values", 80)
+            definitions = module.get_definitions()
+            validator = Validator(definitions, module.get_rules())
+            validator.validate_all(settings_data)
+
+            self._progress("Indexing settings", 90)
+            search_index = SearchIndex(definitions)
+            section_index = SectionIndex(definitions.categories())
+
+            # A cancel during the last step still wins
+            self._progress("Building editor", 100)
+        except LoadCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.loaded.emit(LoadedFile(
+            self.file_path, game_name, module, settings_data, validator, search_index, section_index))
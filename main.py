@@ -2,31 +2,79 @@ import sys
 import os
 import json
 import configparser
-import re
 import datetime
+import time
+from contextlib import contextmanager
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QTabWidget, QWidget, QLabel,
-    QDoubleSpinBox, QSpinBox, QCheckBox, QLineEdit, QComboBox, QFileDialog,
+    QApplication, QMainWindow, QWidget, QLabel, QLineEdit, QFileDialog,
     QMessageBox, QVBoxLayout, QHBoxLayout, QPushButton, 
     QScrollArea, QSplitter, QToolBar, QStatusBar, QFrame,
-    QGridLayout, QSizePolicy, QStyle, QToolButton, QListWidget, QListWidgetItem
+    QGridLayout, QSizePolicy, QStyle, QListWidget, QListWidgetItem,
+    QStackedWidget, QProgressBar
 )
-from PyQt6.QtGui import QFont, QAction, QColor, QPalette, QCursor
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QFont, QAction, QActionGroup, QColor, QPalette, QCursor
+from PyQt6.QtCore import Qt, QSize, QThreadPool, QTimer, pyqtSignal
 
+from file_loader import FileLoadWorker
 from modules.module_loader import ModuleLoader
-from modules.generic_module import GenericModule
+from modules.parse_cache import ParseCache
+from modules.value_store import ValueStore
+from setting_widgets import EditorPool, set_editor_value
+from section_tree import SectionTree
+from settings_table import SettingsTableView
+
+# Files with more settings than this are edited in a table instead of a form
+DEFAULT_TABLE_VIEW_THRESHOLD = 2000
+
+# Maximum number of search results shown as table rows
+TABLE_SEARCH_RESULT_LIMIT = 5000
+
+# Delay after the last keystroke before a search runs, in milliseconds
+SEARCH_DEBOUNCE_MS = 150
+
+# Rows of a form created at once (about one screen); the rest are added from
+# the event loop in slices of at most FORM_SLICE_MS milliseconds
+FORM_INITIAL_ROWS = 30
+FORM_SLICE_MS = 15
+
+# Settings shown by the view filter: all, those changed since the file was
+# opened or saved, or those that differ from their defaults
+VIEW_ALL = 'all'
+VIEW_MODIFIED = 'modified'
+VIEW_NON_DEFAULT = 'non_default'
 
 class IniEditorApp(QMainWindow):
     """Main application window for the INI Editor"""
     
+    # Emitted with the names of the settings whose values changed
+    settingsChanged = pyqtSignal(list)
+    
     def __init__(self):
         super().__init__()
-        self.module_loader = ModuleLoader()
         self.current_module = None
         self.current_file_path = None
-        self.settings_data = {}
+        self.settings_data = ValueStore()
+        self.validator = None
+        self.search_index = None
+        self.section_index = None
+        self.load_worker = None
+        self.form_generation = 0
         self.ui_elements = {}
+        self.settings_table = None
+        self.category_pages = {}
+        self.section_tree = None
+        self.category_list = None
+        self.no_results_label = None
+        self.setting_rows = {}
+        self.search_input = None
+        self.search_matches = None
+        self.view_filter = VIEW_ALL
+        self.show_descriptions = True
+        self.described_row = None
+        self.bulk_changes = None
+        self.dirty_keys = set()
+        self.pending_changes = {}
+        self.pending_status = None
         self.edited = False
         self.dark_mode = True  # Always dark mode
         
@@ -35,6 +83,32 @@ class IniEditorApp(QMainWindow):
         self.settings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app_settings.ini')
         self.load_app_settings()
         
+        # Parsed files are cached next to the app settings so reopening them is instant
+        self.module_loader = ModuleLoader(parse_cache=self.create_parse_cache())
+        
+        # Setting rows are reused when switching between files
+        self.editor_pool = EditorPool(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+        
+        # Searching waits until typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.filterSettings(self.searchText()))
+        
+        # Edits are collected and shown in the status bar once per event loop iteration
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(0)
+        self.status_timer.timeout.connect(self.flushChanges)
+        
+        # The description of the setting being edited is shown under its editor
+        QApplication.instance().focusChanged.connect(self.onFocusChanged)
+        try:
+            self.table_view_threshold = self.app_settings.getint(
+                'General', 'table_view_threshold', fallback=DEFAULT_TABLE_VIEW_THRESHOLD)
+        except ValueError:
+            self.table_view_threshold = DEFAULT_TABLE_VIEW_THRESHOLD
+        
         # Setup dark theme
         self.apply_dark_theme()
         
@@ -58,6 +132,16 @@ class IniEditorApp(QMainWindow):
         else:
             self.app_settings.read(self.settings_file)
     
+    def create_parse_cache(self):
+        """Create the persistent parse cache using the limits from the app settings"""
+        cache_dir = os.path.join(os.path.dirname(self.settings_file), 'parse_cache')
+        try:
+            max_entries = self.app_settings.getint('General', 'parse_cache_max_entries', fallback=32)
+            max_mb = self.app_settings.getint('General', 'parse_cache_max_mb', fallback=64)
+        except ValueError:
+            max_entries, max_mb = 32, 64
+        return ParseCache(cache_dir, max_entries=max_entries, max_bytes=max_mb * 1024 * 1024)
+    
     def save_app_settings(self):
         """Save application settings to config file"""
         # Update current settings
@@ -261,14 +345,122 @@ class IniEditorApp(QMainWindow):
             }
             
             #headerWidget {
-                background-color: #2980b9;
+                background-color: #3498db;
+            }
+        """
+        
+        # Widgets identified by object name or dynamic property (see setting_widgets.py)
+        widget_style = """
+            QLabel[description="true"] {
+                color: #aaaaaa;
+                font-size: 8pt;
+                font-style: italic;
+                padding-top: 2px;
+                padding-bottom: 8px;
+            }
+            
+            QLabel#headerLabel {
+                color: white;
+                font-size: 16pt;
+                font-weight: bold;
+            }
+            
+            QLabel#settingLabel {
+                font-weight: bold;
+            }
+            
+            QLabel#settingLabel[compact="true"] {
+                font-size: 9pt;
+            }
+            
+            QSpinBox#settingEditor, QDoubleSpinBox#settingEditor,
+            QComboBox#settingEditor, QLineEdit#settingEditor {
+                min-width: 150px;
+            }
+            
+            QSpinBox#settingEditor[compact="true"], QDoubleSpinBox#settingEditor[compact="true"],
+            QComboBox#settingEditor[compact="true"], QLineEdit#settingEditor[compact="true"] {
+                min-width: 120px;
+            }
+            
+            QLabel#noResultsLabel {
+                color: #aaaaaa;
+                font-style: italic;
+            }
+            
+            QLabel#editStatusLabel[state="modified"] {
+                color: #e74c3c;
+                font-weight: bold;
+            }
+            
+            QLabel#editStatusLabel[state="saved"] {
+                color: #27ae60;
+                font-weight: bold;
+            }
+            
+            QListWidget#categoryList {
+                background-color: #2d2d2d;
+                border-radius: 5px;
+                padding: 3px;
+            }
+            
+            QListWidget#categoryList::item {
+                padding: 6px;
+                border-radius: 3px;
+            }
+            
+            QListWidget#categoryList::item:selected {
+                background-color: #1e2a38;
+                color: white;
+            }
+            
+            QListWidget#categoryList::item:hover:!selected {
+                background-color: #3a3a3a;
+            }
+            
+            QTreeWidget#sectionTree {
+                background-color: #2d2d2d;
+                border-radius: 5px;
+                padding: 3px;
+            }
+            
+            QTreeWidget#sectionTree::item {
+                padding: 3px;
+            }
+            
+            QTreeWidget#sectionTree::item:selected {
+                background-color: #1e2a38;
+                color: white;
+            }
+            
+            QTreeWidget#sectionTree::item:hover:!selected {
+                background-color: #3a3a3a;
+            }
+            
+            QTableView#settingsTable {
+                background-color: #2d2d2d;
+                alternate-background-color: #333333;
+                gridline-color: #3a3a3a;
+                border-radius: 5px;
+            }
+            
+            QTableView#settingsTable::item:selected {
+                background-color: #1e2a38;
+                color: white;
+            }
+            
+            QTableView#settingsTable QHeaderView::section {
+                background-color: #1e2a38;
+                color: white;
+                padding: 4px;
+                border: none;
             }
         """
         
         # Write stylesheet to file
         try:
             with open(style_file, 'w') as f:
-                f.write(common_style + dark_style)
+                f.write(common_style + dark_style + widget_style)
         except Exception as e:
             print(f"Error creating stylesheet: {str(e)}")
     
@@ -309,6 +501,19 @@ class IniEditorApp(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready - No file loaded")
+        
+        # Progress of a file being loaded in the background
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setMaximumWidth(200)
+        self.load_progress.setVisible(False)
+        self.status_bar.addPermanentWidget(self.load_progress)
+        
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.setToolTip("Stop loading the file")
+        self.cancel_load_button.clicked.connect(self.cancelLoading)
+        self.cancel_load_button.setVisible(False)
+        self.status_bar.addPermanentWidget(self.cancel_load_button)
     
     def setupMenu(self):
         """Setup the application menu bar"""
@@ -371,6 +576,35 @@ class IniEditorApp(QMainWindow):
         reset_action.triggered.connect(self.resetAllSettings)
         edit_menu.addAction(reset_action)
         
+        # View menu
+        view_menu = menu_bar.addMenu("&View")
+        
+        self.descriptions_action = QAction("Show &Descriptions", self)
+        self.descriptions_action.setCheckable(True)
+        self.descriptions_action.setStatusTip("Show setting descriptions for the current game")
+        self.descriptions_action.toggled.connect(self.toggleDescriptions)
+        self.descriptions_action.setEnabled(False)
+        view_menu.addAction(self.descriptions_action)
+        
+        view_menu.addSeparator()
+        
+        # Exclusive filters; the search applies on top of them
+        self.view_filter_group = QActionGroup(self)
+        self.view_filter_actions = {}
+        for view_filter, text, tip in (
+                (VIEW_ALL, "Show &All Settings", "Show every setting"),
+                (VIEW_MODIFIED, "Show &Modified Settings", "Show only the settings changed since the file was opened or saved"),
+                (VIEW_NON_DEFAULT, "Show &Non-Default Settings", "Show only the settings that differ from their default values")):
+            action = QAction(text, self)
+            action.setCheckable(True)
+            action.setChecked(view_filter == VIEW_ALL)
+            action.setStatusTip(tip)
+            action.setEnabled(False)
+            action.triggered.connect(lambda _checked, f=view_filter: self.setViewFilter(f))
+            self.view_filter_group.addAction(action)
+            self.view_filter_actions[view_filter] = action
+            view_menu.addAction(action)
+        
         # Help menu
         help_menu = menu_bar.addMenu("&Help")
         
@@ -516,75 +750,123 @@ class IniEditorApp(QMainWindow):
         # Save the directory for next time
         self.app_settings['General']['last_directory'] = os.path.dirname(file_path)
         
+        # Detection and parsing run in a worker thread; onFileLoaded shows the result
+        worker = FileLoadWorker(self.module_loader, file_path)
+        worker.signals.progress.connect(self.onLoadProgress)
+        worker.signals.loaded.connect(self.onFileLoaded)
+        worker.signals.failed.connect(self.onLoadFailed)
+        worker.signals.cancelled.connect(self.onLoadCancelled)
+        self.load_worker = worker
+        self.setLoading(True)
+        self.status_bar.showMessage(f"Loading file: {os.path.basename(file_path)}...")
+        QThreadPool.globalInstance().start(worker)
+    
+    def setLoading(self, loading):
+        """Show or hide the load progress, and lock the editor while a file is loading"""
+        self.load_progress.setValue(0)
+        self.load_progress.setVisible(loading)
+        self.cancel_load_button.setEnabled(True)
+        self.cancel_load_button.setVisible(loading)
+        self.open_action.setEnabled(not loading)
+        self.central_widget.setEnabled(not loading)
+        self.setFileActionsEnabled(not loading and self.current_module is not None)
+    
+    def setFileActionsEnabled(self, enabled):
+        """Enable or disable the actions that need an open file"""
+        self.save_action.setEnabled(enabled)
+        self.close_file_action.setEnabled(enabled)
+        self.export_action.setEnabled(enabled)
+        self.import_action.setEnabled(enabled)
+        self.descriptions_action.setEnabled(enabled)
+        for action in self.view_filter_actions.values():
+            action.setEnabled(enabled)
+    
+    def cancelLoading(self):
+        """Stop loading the file; the load ends at its next step"""
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.cancel_load_button.setEnabled(False)
+            self.status_bar.showMessage("Cancelling...")
+    
+    def onLoadProgress(self, message, percent):
+        """Show the progress of the file being loaded"""
+        if self.load_worker is not None and not self.load_worker.is_cancelled():
+            self.load_progress.setValue(percent)
+            self.status_bar.showMessage(f"{message}: {os.path.basename(self.load_worker.file_path)}...")
+    
+    def onFileLoaded(self, loaded):
+        """Show a file loaded by the worker"""
+        worker, self.load_worker = self.load_worker, None
+        if worker is not None and worker.is_cancelled():
+            # Cancelled after the last step; the result is discarded
+            self.onLoadCancelled()
+            return
+        
+        file_path = loaded.file_path
+        detected_game = loaded.game_name
         try:
-            # Show loading message
-            self.status_bar.showMessage(f"Loading file: {os.path.basename(file_path)}...")
-            QApplication.processEvents()  # Update the UI
-            
-            # Detect game from file
-            detected_game, module = self.module_loader.detect_game_from_file(file_path)
-            
-            if module:
-                # Load the settings from the file
-                self.current_module = module
-                self.current_file_path = file_path
-                
-                # Parse the ini file using the module's parser
-                self.settings_data = module.parse_ini_file(file_path)
-                
-                # Clear main layout and create UI for the module
-                self.clearMainLayout()
-                self.createModuleUI(detected_game, module)
-                
-                # Update status and enable save
+            self.current_module = loaded.module
+            self.current_file_path = file_path
+            self.settings_data = loaded.settings_data
+            self.validator = loaded.validator
+            self.search_index = loaded.search_index
+            self.section_index = loaded.section_index
+            self.setLoading(False)
+            
+            # Clear main layout and create UI for the module
+            self.clearMainLayout()
+            self.createModuleUI(detected_game or "Generic", loaded.module)
+            self.clearChanges()
+            
+            # Update status and window title
+            if detected_game:
                 self.status_bar.showMessage(f"Loaded {detected_game} settings from {os.path.basename(file_path)}")
-                self.save_action.setEnabled(True)
-                self.export_action.setEnabled(True)
-                self.import_action.setEnabled(True)
-                self.close_file_action.setEnabled(True)
-                self.edited = False
-                
-                # Update window title to include file name
                 self.setWindowTitle(f"Game Settings Editor - {os.path.basename(file_path)}")
             else:
-                # No specific module found, load generic module
-                generic_module = GenericModule()
-                self.current_module = generic_module
-                self.current_file_path = file_path
-                
-                # Parse the ini file using the generic parser
-                self.settings_data = generic_module.parse_ini_file(file_path)
-                
-                # Clear main layout and create UI for generic editing
-                self.clearMainLayout()
-                self.createModuleUI("Generic", generic_module)
-                
-                # Update status and enable save
+                # No specific module found, the generic module was used
                 self.status_bar.showMessage(f"Loaded generic INI file: {os.path.basename(file_path)}")
-                self.save_action.setEnabled(True)
-                self.export_action.setEnabled(True)
-                self.import_action.setEnabled(True)
-                self.close_file_action.setEnabled(True)
-                self.edited = False
-                
-                # Update window title to include file name
                 self.setWindowTitle(f"Game Settings Editor - {os.path.basename(file_path)} (Generic)")
         
         except Exception as e:
-            error_message = f"Failed to open file: {str(e)}"
-            QMessageBox.critical(self, "Error Opening File", error_message)
-            self.status_bar.showMessage(f"Error: {error_message}")
+            self.onLoadFailed(str(e))
+    
+    def onLoadFailed(self, message):
+        """Report a file that could not be loaded"""
+        self.load_worker = None
+        self.setLoading(False)
+        error_message = f"Failed to open file: {message}"
+        QMessageBox.critical(self, "Error Opening File", error_message)
+        self.status_bar.showMessage(f"Error: {error_message}")
+    
+    def onLoadCancelled(self):
+        """Keep the current file after a load was cancelled"""
+        self.load_worker = None
+        self.setLoading(False)
+        self.status_bar.showMessage("Loading cancelled")
     
     def clearMainLayout(self):
         """Clear the main layout to prepare for loading a new module UI"""
+        # Forms of the previous module UI stop filling in
+        self.form_generation += 1
+        
         # Remove the splash screen or previous module UI
         if hasattr(self, 'splash_widget') and self.splash_widget:
             self.splash_widget.setParent(None)
             self.splash_widget = None
         
         if hasattr(self, 'module_widget') and self.module_widget:
-            self.module_widget.setParent(None)
+            # Keep the setting rows for the next file. The old UI is only hidden,
+            # not detached: moving a widget to another window walks the focus
+            # chain of both, which is slow for thousands of rows
+            self.main_layout.removeWidget(self.module_widget)
+            self.module_widget.hide()
+            if self.described_row is not None:
+                self.described_row.show_description(False)
+            self.editor_pool.release(self.setting_rows.values(), self.module_widget)
             self.module_widget = None
+        self.setting_rows = {}
+        self.described_row = None
+        self.ui_elements = {}
         
         # Clear any other widgets in the main layout
         while self.main_layout.count():
@@ -604,6 +886,26 @@ class IniEditorApp(QMainWindow):
         # Store reference to module widget and layout
         self.module_widget = module_widget
         self.module_layout = module_layout
+        self.settings_table = None
+        self.category_pages = {}
+        self.section_tree = None
+        self.category_list = None
+        self.no_results_label = None
+        self.setting_rows = {}
+        self.search_input = None
+        self.search_matches = None
+        self.search_timer.stop()
+        self.ui_elements = {}
+        
+        # A new file starts with all settings shown
+        self.view_filter = VIEW_ALL
+        self.view_filter_actions[VIEW_ALL].setChecked(True)
+        
+        # Descriptions are switched per module; the View menu shows the switch
+        self.show_descriptions = self.descriptionsEnabled(module)
+        self.descriptions_action.blockSignals(True)
+        self.descriptions_action.setChecked(self.show_descriptions)
+        self.descriptions_action.blockSignals(False)
         
         
         # Only show header for non-Palworld games
@@ -611,13 +913,6 @@ class IniEditorApp(QMainWindow):
             # Create header with game name and icon
             header_widget = QWidget()
             header_widget.setObjectName("headerWidget")
-            header_widget.setStyleSheet("""
-                #headerWidget {
-                    background-color: #3498db;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                }
-            """)
             
             header_layout = QHBoxLayout(header_widget)
             header_layout.setContentsMargins(20, 15, 20, 15)
@@ -630,12 +925,8 @@ class IniEditorApp(QMainWindow):
             
             # Add game name in large text
             header_label = QLabel(f"{game_name} Settings Editor")
-            header_label.setStyleSheet("color: white; font-weight: bold;")
+            header_label.setObjectName("headerLabel")
             header_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            font = QFont()
-            font.setPointSize(16)
-            font.setBold(True)
-            header_label.setFont(font)
             header_layout.addWidget(header_label, 1)
             
             module_layout.addWidget(header_widget)
@@ -652,7 +943,7 @@ class IniEditorApp(QMainWindow):
             self.statusBar().showMessage(f"Editing: {os.path.basename(self.current_file_path)}")
         
         # Create search widget if we have a lot of settings
-        if len(module.get_all_settings()) > 10:
+        if len(module.get_definitions()) > 10:
             search_widget = QWidget()
             search_layout = QHBoxLayout(search_widget)
             search_layout.setContentsMargins(0, 0, 0, 10)
@@ -662,7 +953,7 @@ class IniEditorApp(QMainWindow):
             
             search_input = QLineEdit()
             search_input.setPlaceholderText("Type to search settings...")
-            search_input.textChanged.connect(self.filterSettings)
+            search_input.textChanged.connect(lambda _text: self.search_timer.start())
             self.search_input = search_input
             search_layout.addWidget(search_input, 1)
             
@@ -675,8 +966,23 @@ class IniEditorApp(QMainWindow):
         main_content_layout.setSpacing(10)
         module_layout.addWidget(self.main_content_widget)
         
+        # Shown instead of the rows when a search has no matches
+        self.no_results_label = QLabel("No matching settings found.")
+        self.no_results_label.setObjectName("noResultsLabel")
+        self.no_results_label.setVisible(False)
+        module_layout.addWidget(self.no_results_label)
+        
+        definitions = module.get_definitions()
+        if len(definitions) > self.table_view_threshold:
+            # Too many settings for a form with widgets per setting; use a
+            # table that only creates an editor for the cell being edited
+            self.settings_table = SettingsTableView(
+                definitions, self.settings_data, self.onSettingChanged, self.validator)
+            self.settings_table.settings_model.show_descriptions = self.show_descriptions
+            main_content_layout.addWidget(self.settings_table, 1)
+        
         # Palworld special left panel for tabs, right side for settings
-        if game_name.lower() == "palworld":
+        elif game_name.lower() == "palworld":
             # Create a splitter for left/right panels
             splitter = QSplitter(Qt.Orientation.Horizontal)
             
@@ -697,46 +1003,31 @@ class IniEditorApp(QMainWindow):
             
             # Create a list widget for categories - narrower
             category_list = QListWidget()
+            self.category_list = category_list
             category_list.setMinimumWidth(150)
             category_list.setMaximumWidth(180)
-            category_list.setStyleSheet("""
-                QListWidget {
-                    background-color: #2d2d2d;
-                    border-radius: 5px;
-                    padding: 3px;
-                }
-                QListWidget::item {
-                    padding: 6px;
-                    border-radius: 3px;
-                }
-                QListWidget::item:selected {
-                    background-color: #1e2a38;
-                    color: white;
-                }
-                QListWidget::item:hover:!selected {
-                    background-color: #3a3a3a;
-                }
-            """)
+            category_list.setObjectName("categoryList")
             
             # Get categories
-            if hasattr(module, 'get_categories') and callable(module.get_categories):
-                categories = module.get_categories()
-                
+            categories = definitions.categories()
+            if categories:
                 # Add categories to list with icons
                 for category in categories:
                     item = QListWidgetItem(category)
                     item.setIcon(self.getCategoryIcon(category))
                     category_list.addItem(item)
                 
-                # Connect selection change
-                category_list.currentRowChanged.connect(lambda idx: self.showCategorySettings(idx, categories, module, right_panel))
-                
                 left_layout.addWidget(category_list)
                 
-                # Right panel for settings
+                # Right panel for settings; each category page is built once and kept in the stack
                 right_panel = QWidget()
                 right_layout = QVBoxLayout(right_panel)
                 right_layout.setContentsMargins(10, 10, 10, 10)
+                category_stack = QStackedWidget()
+                right_layout.addWidget(category_stack)
+                
+                # Connect selection change
+                category_list.currentRowChanged.connect(lambda idx: self.showCategorySettings(idx, categories, module, category_stack))
                 
                 # Add panels to splitter
                 splitter.addWidget(left_panel)
@@ -755,54 +1046,27 @@ class IniEditorApp(QMainWindow):
                 # Fallback to standard layout if no categories
                 self.createSettingsForm(main_content_layout, module)
         else:
-            # Standard tabbed interface for other games
-            if hasattr(module, 'get_categories') and callable(module.get_categories):
-                categories = module.get_categories()
-                if categories:
-                    tab_widget = QTabWidget()
-                    tab_widget.setDocumentMode(True)
-                    tab_widget.setTabPosition(QTabWidget.TabPosition.North)
-                    
-                    # Create a tab for each category
-                    for category in categories:
-                        category_widget = QWidget()
-                        category_layout = QGridLayout(category_widget)
-                        category_layout.setContentsMargins(15, 15, 15, 15)
-                        category_layout.setHorizontalSpacing(15)
-                        category_layout.setVerticalSpacing(10)
-                        category_layout.setColumnStretch(0, 0)  # Label column
-                        category_layout.setColumnStretch(1, 1)  # Widget column
-                        category_layout.setColumnStretch(2, 0)  # Reset column
-                        
-                        # Get settings for this category
-                        category_settings = module.get_settings_by_category(category)
-                        
-                        # Create UI elements for each setting
-                        row = 0
-                        for setting in category_settings:
-                            widgets = self.addSettingToLayout(category_layout, setting, module, row)
-                            # Tag widgets with category for filtering
-                            for widget in widgets:
-                                if widget:
-                                    widget.setProperty("category", category)
-                                    widget.setProperty("setting_name", setting.get('name', ''))
-                            row += 1
-                        
-                        # Add a scroll area for the category
-                        scroll = QScrollArea()
-                        scroll.setWidgetResizable(True)
-                        scroll.setWidget(category_widget)
-                        
-                        # Add tab with icon based on category
-                        icon = self.getCategoryIcon(category)
-                        tab_widget.addTab(scroll, icon, category)
-                    
-                    main_content_layout.addWidget(tab_widget, 1)
-                else:
-                    # No categories, create a single form
-                    self.createSettingsForm(main_content_layout, module)
+            # Section tree for other games; files can have thousands of sections
+            if self.section_index:
+                splitter = QSplitter(Qt.Orientation.Horizontal)
+                
+                # Tree nodes are created when expanded, and a section's page
+                # is only built the first time it is selected
+                section_tree = SectionTree(self.section_index)
+                self.section_tree = section_tree
+                category_stack = QStackedWidget()
+                section_tree.sectionSelected.connect(
+                    lambda category: self.showCategoryPage(category, module, category_stack))
+                
+                splitter.addWidget(section_tree)
+                splitter.addWidget(category_stack)
+                splitter.setStretchFactor(1, 1)
+                splitter.setSizes([250, 750])
+                main_content_layout.addWidget(splitter, 1)
+                
+                section_tree.selectFirstSection()
             else:
-                # Module doesn't support categories, create a single form
+                # No categories, create a single form
                 self.createSettingsForm(main_content_layout, module)
         
         # Add bottom buttons (reset, etc.)
@@ -812,6 +1076,7 @@ class IniEditorApp(QMainWindow):
         
         # Add info about edited status
         self.edit_status_label = QLabel("No changes made")
+        self.edit_status_label.setObjectName("editStatusLabel")
         button_layout.addWidget(self.edit_status_label)
         
         button_layout.addStretch()
@@ -860,247 +1125,96 @@ class IniEditorApp(QMainWindow):
         # Default icon
         return self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
     
+    def searchText(self):
+        """Return the text of the search field, or '' if the current file has none"""
+        return self.search_input.text() if self.search_input is not None else ''
+    
+    def setViewFilter(self, view_filter):
+        """Show all, modified or non-default settings (VIEW_ALL, VIEW_MODIFIED, VIEW_NON_DEFAULT)"""
+        self.view_filter = view_filter
+        self.view_filter_actions[view_filter].setChecked(True)
+        if self.current_module is not None:
+            self.search_timer.stop()
+            self.filterSettings(self.searchText())
+    
+    def viewFilterKeys(self):
+        """Return the names of the settings kept by the view filter, or None if it keeps all"""
+        if self.view_filter == VIEW_MODIFIED:
+            return set(self.dirty_keys)
+        if self.view_filter == VIEW_NON_DEFAULT:
+            return self.settings_data.non_default_keys()
+        return None
+    
     def filterSettings(self, text):
-        """Filter settings based on search text"""
+        """Show only the settings matching the search text and view filter, hiding the other rows in place"""
         try:
-            # If we have a search results panel already, remove it
-            if hasattr(self, 'search_results_panel') and self.search_results_panel:
-                self.search_results_panel.setParent(None)
-                self.search_results_panel = None
-            
-            # If search is empty, restore normal view
-            if not text or not text.strip():
-                # Show all normal UI elements
-                if hasattr(self, 'main_content_widget'):
-                    self.main_content_widget.setVisible(True)
+            text = text.strip()
+            definitions = self.current_module.get_definitions()
+            kept = self.viewFilterKeys()
+            
+            # The table view shows the matching rows itself
+            if self.settings_table is not None:
+                if text:
+                    results = self.search_index.search(text, TABLE_SEARCH_RESULT_LIMIT)
+                    if kept is not None:
+                        results = [setting for setting in results if setting.name in kept]
+                    self.settings_table.showSettings(results)
+                elif kept is not None:
+                    self.settings_table.showSettings([setting for setting in definitions if setting.name in kept])
+                else:
+                    self.settings_table.showSettings(None)
                 return
             
-            # Hide the main content when searching
-            if hasattr(self, 'main_content_widget'):
-                self.main_content_widget.setVisible(False)
-            
-            # Create a search results panel
-            self.search_results_panel = QWidget()
-            self.search_results_panel.setObjectName("searchResultsPanel")
-            
-            # Add the search results panel to the main layout
-            if hasattr(self, 'main_layout') and self.main_layout:
-                self.main_layout.addWidget(self.search_results_panel)
-            else:
-                # Fallback if main_layout is not available
-                self.centralWidget().layout().addWidget(self.search_results_panel)
-            
-            # Create layout for search results
-            results_layout = QVBoxLayout(self.search_results_panel)
-            results_layout.setContentsMargins(10, 10, 10, 10)
-            results_layout.setSpacing(10)
-            
-            # Add a header for search results
-            header = QLabel(f"Search Results for: '{text}'")
-            header.setStyleSheet("font-weight: bold; font-size: 14px; color: #3498db;")
-            results_layout.addWidget(header)
-            
-            # Create a scroll area for results
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            
-            # Container for results
-            results_container = QWidget()
-            results_container_layout = QVBoxLayout(results_container)
-            results_container_layout.setContentsMargins(5, 5, 5, 5)
-            results_container_layout.setSpacing(10)
-            
-            # Get all settings from the current module
-            if self.current_module and hasattr(self.current_module, 'get_all_settings'):
-                all_settings = self.current_module.get_all_settings()
-                
-                # Filter settings based on search text
-                text = text.lower()
-                matching_settings = []
-                
-                for setting in all_settings:
-                    name = setting.get('name', '').lower()
-                    description = setting.get('description', '').lower()
-                    category = setting.get('category', '').lower()
-                    
-                    # Check if setting matches search
-                    if (text in name or text in description or text in category):
-                        matching_settings.append(setting)
-                
-                # If no results found
-                if not matching_settings:
-                    no_results = QLabel("No matching settings found.")
-                    no_results.setStyleSheet("color: #aaa; font-style: italic;")  # Lighter color for dark mode
-                    results_container_layout.addWidget(no_results)
-                    results_container_layout.addStretch(1)
-                else:
-                    # Group results by category
-                    categories = {}
-                    for setting in matching_settings:
-                        category = setting.get('category', 'Uncategorized')
-                        if category not in categories:
-                            categories[category] = []
-                        categories[category].append(setting)
-                    
-                    # Add results by category
-                    for category, settings in categories.items():
-                        # Add category header
-                        category_widget = QWidget()
-                        category_layout = QVBoxLayout(category_widget)
-                        category_layout.setContentsMargins(0, 0, 0, 0)
-                        category_layout.setSpacing(5)
-                        
-                        category_header = QLabel(category)
-                        category_header.setStyleSheet("font-weight: bold; background-color: #1e2a38; color: white; padding: 5px; border-radius: 3px;")
-                        category_layout.addWidget(category_header)
-                        
-                        # Add settings in this category
-                        for setting in settings:
-                            # Create a widget for this setting
-                            setting_widget = QWidget()
-                            setting_widget.setStyleSheet("background-color: #2d2d2d; border-radius: 3px; padding: 5px;")  # Dark background for dark mode
-                            setting_layout = QGridLayout(setting_widget)
-                            setting_layout.setContentsMargins(10, 10, 10, 10)
-                            setting_layout.setHorizontalSpacing(15)
-                            setting_layout.setVerticalSpacing(5)
-                            
-                            # Setting name
-                            name_label = QLabel(setting.get('name', ''))
-                            name_label.setStyleSheet("font-weight: bold; color: #ddd;")  # Light text for dark mode
-                            setting_layout.addWidget(name_label, 0, 0)
-                            
-                            # Get the widget for this setting
-                            widget = None
-                            if setting.get('name') in self.ui_elements:
-                                # Create a clone of the widget
-                                original_widget = self.ui_elements[setting.get('name')]
-                                widget = self.cloneWidgetForSearch(original_widget, setting)
-                                setting_layout.addWidget(widget, 0, 1)
-                            
-                            # Description (if available)
-                            if setting.get('description'):
-                                desc_label = QLabel(setting.get('description'))
-                                desc_label.setWordWrap(True)
-                                desc_label.setStyleSheet("color: #aaa; font-style: italic; font-size: 8pt;")  # Lighter color for dark mode
-                                setting_layout.addWidget(desc_label, 1, 0, 1, 2)
-                            
-                            category_layout.addWidget(setting_widget)
-                        
-                        results_container_layout.addWidget(category_widget)
-                    
-                    # Add stretch at the end
-                    results_container_layout.addStretch(1)
-            
-            scroll.setWidget(results_container)
-            results_layout.addWidget(scroll)
+            matches = None
+            categories = None
+            if text and self.search_index:
+                results = self.search_index.search(text, len(definitions))
+                matches = {setting.name for setting in results}
+            if kept is not None:
+                matches = kept if matches is None else matches & kept
+            if matches is not None:
+                categories = set()
+                for name in matches:
+                    setting = definitions.get(name)
+                    if setting is not None:
+                        categories.add(setting.category)
+            self.search_matches = matches
+            
+            # Rows of pages built later are filtered as they are created
+            for name, setting_row in self.setting_rows.items():
+                visible = matches is None or name in matches
+                for widget in setting_row.widgets:
+                    if widget.isHidden() == visible:
+                        widget.setVisible(visible)
+            
+            # Hide the categories without matches
+            if self.section_tree is not None:
+                self.section_tree.setSections(categories)
+            
+            if self.category_list is not None:
+                category_list = self.category_list
+                for index in range(category_list.count()):
+                    item = category_list.item(index)
+                    item.setHidden(categories is not None and item.text() not in categories)
+                current = category_list.currentItem()
+                if current is not None and current.isHidden():
+                    for index in range(category_list.count()):
+                        if not category_list.item(index).isHidden():
+                            category_list.setCurrentRow(index)
+                            break
+            
+            if self.no_results_label is not None:
+                self.no_results_label.setVisible(matches is not None and not matches)
             
         except Exception as e:
             QMessageBox.critical(self, "Search Error", f"An error occurred during search: {str(e)}")
     
-    def cloneWidgetForSearch(self, original_widget, setting):
-        """Create a clone of a widget for the search results panel"""
-        name = setting.get('name', '')
-        setting_type = setting.get('type', 'string')
-        
-        # Get current value
-        current_value = self.settings_data.get(name, setting.get('default', ''))
-        
-        # Create appropriate widget based on setting type
-        if setting_type == 'integer':
-            widget = QSpinBox()
-            widget.setMinimumWidth(150)
-            min_val = setting.get('min', -2147483647)
-            max_val = setting.get('max', 2147483647)
-            widget.setRange(min_val, max_val)
-            widget.setGroupSeparatorShown(True)
-            
-            if current_value:
-                try:
-                    widget.setValue(int(current_value))
-                except (ValueError, TypeError):
-                    widget.setValue(0)
-            widget.valueChanged.connect(lambda val, s=name: self.onSettingChanged(s, val))
-            
-            # Apply dark mode styling
-            widget.setStyleSheet("background-color: #333; color: #ddd; border: 1px solid #555;")
-            
-        elif setting_type == 'float':
-            widget = QDoubleSpinBox()
-            widget.setMinimumWidth(150)
-            min_val = setting.get('min', -1000000.0)
-            max_val = setting.get('max', 1000000.0)
-            widget.setRange(min_val, max_val)
-            widget.setDecimals(6)
-            widget.setGroupSeparatorShown(True)
-            
-            if current_value:
-                try:
-                    widget.setValue(float(current_value))
-                except (ValueError, TypeError):
-                    widget.setValue(0.0)
-            widget.valueChanged.connect(lambda val, s=name: self.onSettingChanged(s, val))
-            
-            # Apply dark mode styling
-            widget.setStyleSheet("background-color: #333; color: #ddd; border: 1px solid #555;")
-            
-        elif setting_type == 'boolean':
-            widget = QCheckBox("Enabled")
-            if isinstance(current_value, str):
-                widget.setChecked(current_value.lower() in ('true', 'yes', '1'))
-            else:
-                widget.setChecked(bool(current_value))
-            widget.stateChanged.connect(lambda state, s=name: self.onSettingChanged(s, state == Qt.CheckState.Checked))
-            
-            # Apply dark mode styling
-            widget.setStyleSheet("color: #ddd;")
-            
-        elif setting_type == 'enum':
-            widget = QComboBox()
-            widget.setMinimumWidth(150)
-            options = setting.get('options', [])
-            for option in options:
-                widget.addItem(option)
-            
-            if current_value and current_value in options:
-                widget.setCurrentText(current_value)
-            widget.currentTextChanged.connect(lambda text, s=name: self.onSettingChanged(s, text))
-            
-            # Apply dark mode styling
-            widget.setStyleSheet("background-color: #333; color: #ddd; border: 1px solid #555;")
-            
-        else:  # Default to string
-            widget = QLineEdit()
-            widget.setMinimumWidth(150)
-            if current_value:
-                widget.setText(str(current_value))
-            widget.textChanged.connect(lambda text, s=name: self.onSettingChanged(s, text))
-            
-            # Apply dark mode styling
-            widget.setStyleSheet("background-color: #333; color: #ddd; border: 1px solid #555;")
-        
-        return widget
-    
     def createSettingsForm(self, parent_layout, module):
         """Create a form layout for all settings when there are no categories"""
         form_widget = QWidget()
-        form_layout = QGridLayout(form_widget)
+        form_layout = QVBoxLayout(form_widget)
         form_layout.setContentsMargins(15, 15, 15, 15)
-        form_layout.setHorizontalSpacing(15)
-        form_layout.setVerticalSpacing(10)
-        form_layout.setColumnStretch(0, 0)  # Label column
-        form_layout.setColumnStretch(1, 1)  # Widget column
-        form_layout.setColumnStretch(2, 0)  # Reset column
-        
-        # Get all settings
-        settings = module.get_all_settings()
-        
-        # Create UI elements for each setting
-        row = 0
-        for setting in settings:
-            self.addSettingToLayout(form_layout, setting, module, row)
-            row += 1
+        form_layout.setSpacing(10)
         
         # Add a scroll area
         scroll = QScrollArea()
@@ -1108,138 +1222,109 @@ class IniEditorApp(QMainWindow):
         scroll.setWidget(form_widget)
         
         parent_layout.addWidget(scroll, 1)
+        
+        # Create UI elements for each setting, the visible ones first
+        self.fillSettingsLayout(form_layout, module.get_definitions(), module)
+    
+    def fillSettingsLayout(self, layout, settings, module):
+        """
+        Add the rows of settings to a form in time-sliced chunks
+        
+        The first rows, which fill the visible part of the form, are added right
+        away. The rest are added from the event loop in slices of at most
+        FORM_SLICE_MS, so the window stays interactive and scrollable while the
+        form fills in. Filling stops if the module UI is replaced in the meantime.
+        
+        Each slice of rows gets its own grid, so adding a slice doesn't lay out
+        the rows added before it again; the label columns of all grids share the
+        width of the widest label.
+        
+        Args:
+            layout (QVBoxLayout): Layout of the form; receives one grid per slice
+            settings (list): Definitions of the settings, in order
+            module: Module of the settings
+        """
+        settings = list(settings)
+        generation = self.form_generation
+        grids = []
+        label_width = 0
+        next_index = 0
+        
+        # Rows stay at the top while the form fills in
+        layout.addStretch(1)
+        
+        def add_chunk(deadline=None, limit=None):
+            nonlocal label_width, next_index
+            chunk = QWidget()
+            grid = QGridLayout(chunk)
+            grid.setContentsMargins(0, 0, 0, 0)
+            grid.setHorizontalSpacing(15)
+            grid.setVerticalSpacing(layout.spacing())
+            grid.setColumnStretch(0, 0)  # Label column
+            grid.setColumnStretch(1, 1)  # Widget column
+            grid.setColumnStretch(2, 0)  # Reset column
+            
+            # The chunk goes into the form before its rows: moving a polished
+            # (reused) row into a chunk and then the chunk into the form would
+            # re-polish the row twice
+            layout.insertWidget(layout.count() - 1, chunk)
+            
+            end = len(settings) if limit is None else min(next_index + limit, len(settings))
+            widest = 0
+            row = 0
+            while next_index < end:
+                label = self.addSettingToLayout(grid, settings[next_index], module, row)[0]
+                label.ensurePolished()
+                widest = max(widest, label.sizeHint().width())
+                next_index += 1
+                row += 1
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+            
+            # Align the label column with the other grids
+            grids.append(grid)
+            if widest > label_width:
+                label_width = widest
+                for other in grids:
+                    other.setColumnMinimumWidth(0, label_width)
+            else:
+                grid.setColumnMinimumWidth(0, label_width)
+        
+        def add_slice():
+            if generation != self.form_generation:
+                return
+            add_chunk(deadline=time.perf_counter() + FORM_SLICE_MS / 1000)
+            if next_index < len(settings):
+                QTimer.singleShot(0, add_slice)
+        
+        add_chunk(limit=FORM_INITIAL_ROWS)
+        if next_index < len(settings):
+            QTimer.singleShot(0, add_slice)
     
     def addSettingToLayout(self, layout, setting, module, row):
         """Add a setting to the given layout with the appropriate widget type"""
-        name = setting.get('name', '')
-        setting_type = setting.get('type', 'string')
-        description = setting.get('description', '')
+        name = setting.name
         
         # Check if this is Palworld module - use more compact UI
         is_palworld = self.current_module and hasattr(self.current_module, 'get_game_name') and self.current_module.get_game_name().lower() == 'palworld'
         
-        # Create label with tooltip for description
-        label = QLabel(name)
-        label.setToolTip(description)
-        font = QFont()
-        font.setBold(True)
-        if is_palworld:
-            font.setPointSize(9)  # Smaller font for Palworld
-        label.setFont(font)
-        
-        # Create a container for the setting widget and its description
-        container = QWidget()
-        container_layout = QVBoxLayout(container)
-        
-        # Make layout more compact for Palworld
-        if is_palworld:
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setSpacing(3)  # Slightly increased spacing
-        else:
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setSpacing(4)  # Slightly increased spacing
-        
         # Get current value from settings data - ensure we're getting the value correctly
         current_value = None
         if name in self.settings_data:
             current_value = self.settings_data[name]
         else:
-            current_value = setting.get('default', '')
-            # Store the default value in settings_data if not present
-            self.settings_data[name] = current_value
-    
-
-        
-        # Create appropriate widget based on setting type
-        if setting_type == 'integer':
-            widget = QSpinBox()
-            if is_palworld:
-                widget.setMinimumWidth(120)
-            else:
-                widget.setMinimumWidth(150)
-            min_val = setting.get('min', -2147483647)
-            max_val = setting.get('max', 2147483647)
-            widget.setRange(min_val, max_val)
-            
-            # Add thousands separator for better readability
-            widget.setGroupSeparatorShown(True)
-            
-            if current_value:
-                try:
-                    widget.setValue(int(current_value))
-                except (ValueError, TypeError):
-                    widget.setValue(0)
-            widget.valueChanged.connect(lambda val, s=name: self.onSettingChanged(s, val))
-        
-        elif setting_type == 'float':
-            widget = QDoubleSpinBox()
-            if is_palworld:
-                widget.setMinimumWidth(120)
-            else:
-                widget.setMinimumWidth(150)
-            min_val = setting.get('min', -1000000.0)
-            max_val = setting.get('max', 1000000.0)
-            widget.setRange(min_val, max_val)
-            widget.setDecimals(6)
-            
-            # Add thousands separator for better readability
-            widget.setGroupSeparatorShown(True)
-            
-            if current_value:
-                try:
-                    widget.setValue(float(current_value))
-                except (ValueError, TypeError):
-                    widget.setValue(0.0)
-            widget.valueChanged.connect(lambda val, s=name: self.onSettingChanged(s, val))
-        
-        elif setting_type == 'boolean':
-            widget = QCheckBox("Enabled")
-            if isinstance(current_value, str):
-                widget.setChecked(current_value.lower() in ('true', 'yes', '1'))
-            else:
-                widget.setChecked(bool(current_value))
-            widget.stateChanged.connect(lambda state, s=name: self.onSettingChanged(s, state == Qt.CheckState.Checked))
-        
-        elif setting_type == 'enum':
-            widget = QComboBox()
-            if is_palworld:
-                widget.setMinimumWidth(120)
-            else:
-                widget.setMinimumWidth(150)
-            options = setting.get('options', [])
-            for option in options:
-                widget.addItem(option)
-            
-            if current_value and current_value in options:
-                widget.setCurrentText(current_value)
-            widget.currentTextChanged.connect(lambda text, s=name: self.onSettingChanged(s, text))
-        
-        else:  # Default to string
-            widget = QLineEdit()
-            if is_palworld:
-                widget.setMinimumWidth(120)
-            else:
-                widget.setMinimumWidth(150)
-            if current_value:
-                widget.setText(str(current_value))
-            widget.textChanged.connect(lambda text, s=name: self.onSettingChanged(s, text))
-        
-        # Add the widget to the container
-        container_layout.addWidget(widget)
-        
-        # Always add description if available (even for Palworld)
-        if description:
-            desc_label = QLabel(description)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: #aaa; font-size: 8pt; margin-top: 2px;")  # Lighter color for dark mode
-            container_layout.addWidget(desc_label)
-        
-        # Create reset button with icon instead of text
-        reset_button = QToolButton()
-        reset_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
-        reset_button.setToolTip(f"Reset to default: {setting.get('default', '')}")
-        reset_button.setFixedSize(24, 24)  # Make it square and compact
-        reset_button.clicked.connect(lambda checked, s=setting: self.resetSetting(s))
+            # Settings missing from the file show their default value; it is
+            # only stored (and saved) once the setting is edited
+            current_value = self.settings_data.default(name)
+        
+        # Reuse the widgets of a previously closed file where possible
+        setting_row, reused = self.editor_pool.acquire(
+            setting, current_value,
+            lambda value, s=name: self.onSettingChanged(s, value),
+            lambda s=setting: self.resetSetting(s),
+            compact=bool(is_palworld), described=self.show_descriptions)
+        label, container, reset_button = setting_row.widgets
+        widget = setting_row.editor
         
         # Add widgets to layout with proper alignment
         layout.addWidget(label, row, 0, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
@@ -1249,59 +1334,83 @@ class IniEditorApp(QMainWindow):
         # Store widget reference for later access
         self.ui_elements[name] = widget
         
+        # Rows are hidden and shown in place when searching; reused rows
+        # are shown explicitly since they may have been hidden by a search
+        self.setting_rows[name] = setting_row
+        visible = self.search_matches is None or name in self.search_matches
+        if reused or not visible:
+            for row_widget in setting_row.widgets:
+                row_widget.setVisible(visible)
+        
         # Return the created widgets for potential further customization
         return [label, container, reset_button]
     
+    def descriptionsEnabled(self, module):
+        """Return whether descriptions are shown for a module: the user's choice, or the module's default"""
+        default = getattr(module, 'show_descriptions', lambda: True)()
+        if not hasattr(module, 'get_game_name'):
+            return default
+        try:
+            return self.app_settings.getboolean('Descriptions', module.get_game_name(), fallback=default)
+        except ValueError:
+            return default
+    
+    def toggleDescriptions(self, checked):
+        """Switch the descriptions of the current module on or off and remember the choice"""
+        self.show_descriptions = checked
+        if self.current_module is not None and hasattr(self.current_module, 'get_game_name'):
+            if 'Descriptions' not in self.app_settings:
+                self.app_settings['Descriptions'] = {}
+            self.app_settings['Descriptions'][self.current_module.get_game_name()] = str(checked)
+            self.save_app_settings()
+        
+        if self.settings_table is not None:
+            self.settings_table.settings_model.show_descriptions = checked
+        for setting_row in self.setting_rows.values():
+            setting_row.set_described(checked)
+        self.described_row = None
+        self.onFocusChanged(None, QApplication.focusWidget())
+    
+    def onFocusChanged(self, old, new):
+        """Show the description of the setting being edited, and only that one"""
+        # Keep the description while another window is active
+        if new is None:
+            return
+        
+        # Focus can be inside an editor, e.g. the line edit of a spin box
+        widget = new
+        while widget is not None and widget.objectName() != "settingEditor":
+            widget = widget.parentWidget()
+        setting_row = None
+        if widget is not None:
+            setting_row = self.setting_rows.get(widget.property("setting"))
+            if setting_row is not None and setting_row.editor is not widget:
+                setting_row = None
+        
+        if setting_row is self.described_row:
+            return
+        if self.described_row is not None:
+            self.described_row.show_description(False)
+        if setting_row is not None:
+            setting_row.show_description()
+        self.described_row = setting_row
+    
     def onSettingChanged(self, setting_name, value):
         """Handle when a setting is changed by the user"""
         self.settings_data[setting_name] = value
-        self.edited = True
         
-        # Update status
-        if self.current_file_path:
-            file_name = os.path.basename(self.current_file_path)
-            self.status_bar.showMessage(f"Editing {file_name} - Unsaved changes")
-            
-            # Update edit status label if available
-            if hasattr(self, 'edit_status_label'):
-                self.edit_status_label.setText("Changes not saved")
-                self.edit_status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+        # Only the changed setting needs to be validated again
+        error = None
+        if self.validator:
+            error = self.validator.validate(setting_name, self.settings_data)
+        
+        self.markChanged((setting_name,), error or "Unsaved changes")
     
     def resetSetting(self, setting):
         """Reset a single setting to its default value"""
-        name = setting.get('name', '')
-        default = setting.get('default', '')
-        
-        if name in self.ui_elements:
-            widget = self.ui_elements[name]
-            setting_type = setting.get('type', 'string')
-            
-            # Set the widget value based on type
-            if setting_type == 'integer':
-                try:
-                    widget.setValue(int(default))
-                except (ValueError, TypeError):
-                    widget.setValue(0)
-            elif setting_type == 'float':
-                try:
-                    widget.setValue(float(default))
-                except (ValueError, TypeError):
-                    widget.setValue(0.0)
-            elif setting_type == 'boolean':
-                widget.setChecked(default.lower() in ('true', 'yes', '1'))
-            elif setting_type == 'enum':
-                widget.setCurrentText(default)
-            else:  # string
-                widget.setText(default)
-            
-            # Update the settings data
-            self.settings_data[name] = default
-            self.edited = True
-            
-            # Update status
-            if self.current_file_path:
-                file_name = os.path.basename(self.current_file_path)
-                self.status_bar.showMessage(f"Reset {name} to default value")
+        name = setting.name
+        with self.bulkUpdate(f"Reset {name} to default value"):
+            self.setSettingValue(name, self.settings_data.default(name))
     
     def resetAllSettings(self):
         """Reset all settings to their default values"""
@@ -1317,30 +1426,152 @@ class IniEditorApp(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Get default values from module
-            defaults = {}
-            for setting in self.current_module.get_all_settings():
-                name = setting.get('name', '')
-                default = setting.get('default', '')
-                defaults[name] = default
-                
-                # Update UI element
-                if name in self.ui_elements:
-                    self.resetSetting(setting)
-            
-            # Update settings data with defaults
-            self.settings_data = defaults
-            self.edited = True
+            # Reset every setting to its decoded default value in one batch
+            with self.bulkUpdate("Reset all settings to default values",
+                                 "All settings reset to defaults (not saved)"):
+                for setting in self.current_module.get_definitions():
+                    name = setting.name
+                    self.setSettingValue(name, self.settings_data.default(name))
+    
+    @contextmanager
+    def bulkUpdate(self, status_message="Unsaved changes", label_text="Changes not saved"):
+        """
+        Apply many setting changes as one transaction
+        
+        Inside the block, setSettingValue updates values and widgets without
+        emitting widget signals, and the window isn't repainted. When the block
+        ends, only the keys that changed are validated, the UI is repainted once
+        and the changes are recorded together, so settingsChanged is emitted
+        once with their names.
+        
+        Args:
+            status_message (str): Status bar message shown if anything changed
+            label_text (str): Edit status label text shown if anything changed
+        
+        Yields:
+            dict: Names of the settings changed so far, in order
+        """
+        # Nested blocks join the outer transaction
+        if self.bulk_changes is not None:
+            yield self.bulk_changes
+            return
+        
+        changed = self.bulk_changes = {}
+        self.setUpdatesEnabled(False)
+        try:
+            yield changed
+        finally:
+            self.bulk_changes = None
+            try:
+                if changed:
+                    if self.validator:
+                        self.validator.validate_keys(changed, self.settings_data)
+                    if self.settings_table is not None:
+                        self.settings_table.refresh()
+                    self.markChanged(changed, status_message, label_text)
+                    # Reset or imported settings may enter or leave the filtered view
+                    if self.view_filter != VIEW_ALL:
+                        self.search_timer.start()
+            finally:
+                self.setUpdatesEnabled(True)
+    
+    def setSettingValue(self, name, value):
+        """
+        Set a setting's value from code (reset, import) and show it in its widget
+        
+        Outside of a bulkUpdate block the change is applied as a batch of one.
+        
+        Returns:
+            bool: True if the value changed
+        """
+        if self.bulk_changes is None:
+            with self.bulkUpdate():
+                return self.setSettingValue(name, value)
+        
+        values = self.settings_data
+        had_value = name in values
+        old_value = values.get(name)
+        values[name] = value
+        new_value = values[name]
+        if had_value and type(new_value) is type(old_value) and new_value == old_value:
+            return False
+        
+        widget = self.ui_elements.get(name)
+        if widget is not None:
+            setting = self.current_module.get_definitions().get(name)
+            set_editor_value(widget, setting.type if setting else 'string', new_value)
+        self.bulk_changes[name] = True
+        return True
+    
+    def markChanged(self, names, status_message="Unsaved changes", label_text="Changes not saved"):
+        """
+        Record changed settings; the status is updated once per event loop iteration
+        
+        Args:
+            names (iterable): Names of the changed settings
+            status_message (str): Status bar message for the latest change
+            label_text (str): Edit status label text for the latest change
+        """
+        # Only settings that differ from the file on disk are dirty, so
+        # changing a value back to its original clears it again
+        values = self.settings_data
+        for name in names:
+            if values.is_modified(name):
+                self.dirty_keys.add(name)
+            else:
+                self.dirty_keys.discard(name)
+        self.edited = bool(self.dirty_keys)
+        self.pending_changes.update(dict.fromkeys(names))
+        self.pending_status = (status_message, label_text)
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+    
+    def flushChanges(self):
+        """Show the recorded changes in the status bar and edit status label, and report them"""
+        self.status_timer.stop()
+        if not self.pending_changes:
+            return
+        changed = list(self.pending_changes)
+        self.pending_changes = {}
+        status_message, label_text = self.pending_status
+        
+        if self.current_file_path and not self.dirty_keys:
+            # Every change was reverted to the value in the file
+            file_name = os.path.basename(self.current_file_path)
+            self.status_bar.showMessage(f"Editing {file_name} - No changes from the file on disk")
+            if hasattr(self, 'edit_status_label'):
+                self.setEditStatus("No unsaved changes", "saved")
+        elif self.current_file_path:
+            file_name = os.path.basename(self.current_file_path)
+            modified = len(self.dirty_keys)
+            self.status_bar.showMessage(
+                f"Editing {file_name} - {status_message} ({modified} setting{'s' if modified != 1 else ''} modified)")
             
-            # Update status
-            if self.current_file_path:
-                file_name = os.path.basename(self.current_file_path)
-                self.status_bar.showMessage(f"Reset all settings to default values")
-                
-                # Update edit status label if available
-                if hasattr(self, 'edit_status_label'):
-                    self.edit_status_label.setText("All settings reset to defaults (not saved)")
-                    self.edit_status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            # Update edit status label if available
+            if hasattr(self, 'edit_status_label'):
+                invalid = len(self.validator.errors) if self.validator else 0
+                if invalid:
+                    label_text = f"{label_text} ({invalid} invalid)"
+                self.setEditStatus(label_text, "modified")
+        
+        self.settingsChanged.emit(changed)
+    
+    def clearChanges(self):
+        """Forget the recorded changes, e.g. after saving or opening a file"""
+        self.status_timer.stop()
+        self.pending_changes = {}
+        self.dirty_keys = set()
+        self.edited = False
+    
+    def setEditStatus(self, text, state):
+        """Set the edit status label; its color comes from the stylesheet rule for the state"""
+        label = self.edit_status_label
+        label.setText(text)
+        if label.property("state") != state:
+            # Dynamic properties are only matched when the widget is polished
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
     
     def saveFile(self):
         """Save settings to the INI file"""
@@ -1348,22 +1579,27 @@ class IniEditorApp(QMainWindow):
             return
         
         try:
+            # Report pending edits before they are saved
+            self.flushChanges()
+            
             # Show a temporary "Saving..." message
             self.status_bar.showMessage("Saving changes...")
             QApplication.processEvents()  # Update the UI
             
             # Save the settings using the module's save method
-            self.current_module.save_ini_file(self.current_file_path, self.settings_data)
+            self.module_loader.save_file(self.current_module, self.current_file_path, self.settings_data)
             
-            # Update status
-            self.edited = False
+            # The saved values are the new originals
+            self.settings_data.snapshot()
+            self.clearChanges()
+            if self.view_filter == VIEW_MODIFIED:
+                self.search_timer.start()
             file_name = os.path.basename(self.current_file_path)
             self.status_bar.showMessage(f"Changes saved to {file_name}", 5000)
             
             # Update edit status label if available
             if hasattr(self, 'edit_status_label'):
-                self.edit_status_label.setText("All changes saved")
-                self.edit_status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+                self.setEditStatus("All changes saved", "saved")
             
         except Exception as e:
             QMessageBox.critical(self, "Error Saving File", f"Failed to save file: {str(e)}")
@@ -1460,92 +1696,24 @@ class IniEditorApp(QMainWindow):
             self.status_bar.showMessage("Importing settings...")
             QApplication.processEvents()  # Update the UI
             
-            # Apply imported settings to UI
-            for name, value in imported_settings.items():
-                if name in self.ui_elements:
-                    widget = self.ui_elements[name]
-                    
-                    # Update widget based on its type
-                    if isinstance(widget, QSpinBox):
-                        try:
-                            widget.setValue(int(value))
-                        except (ValueError, TypeError):
-                            pass
-                    elif isinstance(widget, QDoubleSpinBox):
-                        try:
-                            widget.setValue(float(value))
-                        except (ValueError, TypeError):
-                            pass
-                    elif isinstance(widget, QCheckBox):
-                        if isinstance(value, str):
-                            widget.setChecked(value.lower() in ('true', 'yes', '1'))
-                        else:
-                            widget.setChecked(bool(value))
-                    elif isinstance(widget, QComboBox):
-                        try:
-                            widget.setCurrentText(str(value))
-                        except:
-                            pass
-                    elif isinstance(widget, QLineEdit):
-                        widget.setText(str(value))
-            
-            # Update settings data
-            self.settings_data.update(imported_settings)
-            self.edited = True
+            # Apply only the values that differ; they are converted to each setting's type
+            with self.bulkUpdate(f"Settings imported from {os.path.basename(file_path)}",
+                                 "Imported settings (not saved)") as changed:
+                for name, value in imported_settings.items():
+                    self.setSettingValue(name, value)
             
-            # Update status
-            self.status_bar.showMessage(f"Settings imported from {os.path.basename(file_path)} - Unsaved changes", 5000)
-            
-            # Update edit status label if available
-            if hasattr(self, 'edit_status_label'):
-                self.edit_status_label.setText("Imported settings (not saved)")
-                self.edit_status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            if not changed:
+                self.status_bar.showMessage("Imported settings match the current values", 5000)
             
         except Exception as e:
             QMessageBox.critical(self, "Error Importing", f"Failed to import settings: {str(e)}")
     
     def validateSettings(self):
-        """Validate all settings according to their constraints using regex patterns"""
-        if not self.current_module or not self.settings_data:
+        """Report the current validation errors; the error set is kept up to date as settings change"""
+        if not self.current_module or not self.validator:
             return True
         
-        errors = []
-        
-        for setting in self.current_module.get_all_settings():
-            name = setting.get('name', '')
-            setting_type = setting.get('type', 'string')
-            
-            # Skip if setting not in current data
-            if name not in self.settings_data:
-                continue
-                
-            value = self.settings_data[name]
-            
-            # Validate based on type
-            if setting_type == 'string' and 'pattern' in setting:
-                pattern = setting['pattern']
-                if not re.match(pattern, str(value)):
-                    errors.append(f"'{name}' does not match the required pattern")
-            
-            elif setting_type == 'integer':
-                min_val = setting.get('min', -2147483647)
-                max_val = setting.get('max', 2147483647)
-                try:
-                    int_val = int(value)
-                    if int_val < min_val or int_val > max_val:
-                        errors.append(f"'{name}' must be between {min_val} and {max_val}")
-                except ValueError:
-                    errors.append(f"'{name}' must be an integer")
-            
-            elif setting_type == 'float':
-                min_val = setting.get('min', -1000000.0)
-                max_val = setting.get('max', 1000000.0)
-                try:
-                    float_val = float(value)
-                    if float_val < min_val or float_val > max_val:
-                        errors.append(f"'{name}' must be between {min_val} and {max_val}")
-                except ValueError:
-                    errors.append(f"'{name}' must be a number")
+        errors = self.validator.messages()
         
         if errors:
             error_msg = "The following validation errors were found:\n\n" + "\n".join(errors)
@@ -1571,51 +1739,54 @@ class IniEditorApp(QMainWindow):
                 event.ignore()
                 return
         
+        # Stop a file that is still loading
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            QThreadPool.globalInstance().waitForDone()
+        
         # Save application settings
         self.save_app_settings()
         
         # Accept the event (close the window)
         event.accept()
 
-    def showCategorySettings(self, index, categories, module, right_panel):
-        """Show settings for a selected category"""
+    def showCategorySettings(self, index, categories, module, category_stack):
+        """Show settings for a selected category, building its page the first time"""
         if index < 0 or index >= len(categories):
             return
-            
-        # Clear the right panel
-        for i in reversed(range(right_panel.layout().count())): 
-            right_panel.layout().itemAt(i).widget().setParent(None)
-        
-        category = categories[index]
         
+        self.showCategoryPage(categories[index], module, category_stack)
+    
+    def showCategoryPage(self, category, module, category_stack):
+        """Show the settings page of a category, building it the first time"""
+        page = self.category_pages.get(category)
+        if page is None:
+            page = self.category_pages[category] = self.createCategoryPage(category, module)
+            category_stack.addWidget(page[0])
+        
+        category_stack.setCurrentWidget(page[0])
+    
+    def createCategoryPage(self, category, module):
+        """Create the scrollable settings page of a category; returns (page, settings)"""
         # Get settings for this category
-        settings = module.get_settings_by_category(category)
-        
+        settings = module.get_definitions().by_category(category)
         
         # Create a form layout for the settings
         form_widget = QWidget()
-        form_layout = QGridLayout(form_widget)
+        form_layout = QVBoxLayout(form_widget)
         form_layout.setContentsMargins(10, 10, 10, 10)
-        form_layout.setHorizontalSpacing(15)
-        form_layout.setVerticalSpacing(10)
-        form_layout.setColumnStretch(0, 0)  # Label column
-        form_layout.setColumnStretch(1, 1)  # Widget column
-        form_layout.setColumnStretch(2, 0)  # Reset column
-        
-        # Add settings to the form
-        row = 0
-        for setting in settings:
-            self.addSettingToLayout(form_layout, setting, module, row)
-            row += 1
+        form_layout.setSpacing(10)
         
         # Add a scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setWidget(form_widget)
         
-        # Add to right panel
-        right_panel.layout().addWidget(scroll)
-
+        # Add settings to the form, the visible ones first
+        self.fillSettingsLayout(form_layout, settings, module)
+        
+        return scroll, settings
+    
     def closeFile(self):
         """Close the currently open file and return to the splash screen"""
         # Check for unsaved changes
@@ -1638,15 +1809,23 @@ class IniEditorApp(QMainWindow):
         # Reset variables
         self.current_module = None
         self.current_file_path = None
-        self.settings_data = {}
+        self.settings_data = ValueStore()
+        self.validator = None
+        self.search_index = None
+        self.section_index = None
+        self.search_timer.stop()
+        self.search_input = None
+        self.search_matches = None
+        self.setting_rows = {}
+        self.section_tree = None
+        self.category_list = None
+        self.no_results_label = None
         self.ui_elements = {}
-        self.edited = False
+        self.settings_table = None
+        self.clearChanges()
         
         # Disable actions
-        self.save_action.setEnabled(False)
-        self.close_file_action.setEnabled(False)
-        self.export_action.setEnabled(False)
-        self.import_action.setEnabled(False)
+        self.setFileActionsEnabled(False)
         
         # Clear status bar
         self.statusBar().clearMessage()
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+from modules.setting_def import SettingDefinitions
+from modules.value_codecs import DEFAULT_CODECS
+
 class BaseModule(ABC):
     """
     Abstract base class for game modules.
@@ -39,6 +42,77 @@ class BaseModule(ABC):
         """
         pass
     
+    def get_definitions(self):
+        """
+        Return all settings definitions as an indexed collection
+        
+        Modules that keep their definitions in a SettingDefinitions container
+        should override this and return it directly. The default wraps the
+        dictionaries returned by get_all_settings and rebuilds the wrapper only
+        when that list changes.
+        
+        Returns:
+            SettingDefinitions: Definitions with name and category indexes
+        """
+        settings = self.get_all_settings()
+        if hasattr(settings, 'by_category'):
+            return settings
+        
+        cached = getattr(self, '_wrapped_definitions', None)
+        if cached is None or cached[0] is not settings or cached[2] != len(settings):
+            cached = (settings, SettingDefinitions.from_dicts(settings), len(settings))
+            self._wrapped_definitions = cached
+        return cached[1]
+    
+    def get_codecs(self):
+        """
+        Return the codecs used to decode and encode the values of this module's files
+        
+        Modules that write values differently (e.g. a fixed number of decimals)
+        should return a copy of the default registry with those codecs replaced.
+        
+        Returns:
+            CodecRegistry: Codecs by setting type
+        """
+        return DEFAULT_CODECS
+    
+    def saves_typed_values(self):
+        """
+        Return whether save_ini_file receives the typed values of the editor
+        
+        By default save_ini_file is given the values as text, encoded with
+        get_codecs(). Modules returning True are given the ValueStore itself:
+        int, float and bool values, which they have to encode (e.g. with
+        ValueStore.encode), and modified_keys() to find what changed.
+        
+        Returns:
+            bool: True to receive typed values
+        """
+        return False
+    
+    def show_descriptions(self):
+        """
+        Return whether the editor shows the descriptions of this module's settings
+        
+        Descriptions are shown as tooltips and under the setting being edited.
+        Modules whose descriptions carry no information (e.g. generated text)
+        should return False, so the editor doesn't render them at all. Users can
+        change this per module from the View menu.
+        
+        Returns:
+            bool: True to show descriptions
+        """
+        return True
+    
+    def get_rules(self):
+        """
+        Return the rules spanning several settings, e.g. one port differing from another
+        
+        Returns:
+            list: Rule dictionaries with 'left', 'op', 'right' and an optional 'message'
+        """
+        return []
+    
     @abstractmethod
     def get_categories(self):
         """
@@ -73,18 +147,46 @@ class BaseModule(ABC):
         pass
     
     @abstractmethod
-    def parse_ini_file(self, file_path):
+    def parse_ini_file(self, file_path, file_buffer=None):
         """
         Parse an .ini file and return its settings
         
         Args:
             file_path (str): Path to the .ini file
+            file_buffer (FileBuffer, optional): Content already read by the loader;
+                modules should use it instead of reading the file again
             
         Returns:
             dict: Dictionary of setting names to their values
         """
         pass
     
+    def get_parse_state(self):
+        """
+        Return the result of the last parse for the persistent parse cache
+        
+        Returns:
+            dict: JSON-serializable state, or None if the module doesn't support caching
+        """
+        return None
+    
+    def restore_parse_state(self, state, file_path, file_buffer):
+        """
+        Restore a state returned by get_parse_state instead of parsing the file
+        
+        The settings must come in the order parse_ini_file returned them: the
+        loader caches their decoded values in that order.
+        
+        Args:
+            state (dict): State previously returned by get_parse_state
+            file_path (str): Path to the .ini file
+            file_buffer (FileBuffer): The file's content, unchanged since the state was stored
+            
+        Returns:
+            dict: Dictionary of setting names to their values, or None if the module doesn't support caching
+        """
+        return None
+    
     @abstractmethod
     def save_ini_file(self, file_path, settings):
         """
@@ -92,6 +194,7 @@ class BaseModule(ABC):
         
         Args:
             file_path (str): Path to the .ini file
-            settings (dict): Dictionary of setting names to their values
+            settings (dict): Dictionary of setting names to their values as text,
+                or a ValueStore of typed values if saves_typed_values() returns True
         """
         pass 
\ No newline at end of file
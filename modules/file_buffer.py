@@ -0,0 +1,68 @@
+"""
+Shared, read-once file content.
+
+Opening a file goes through detection, parsing and (for some modules) a backup.
+A FileBuffer holds the raw bytes from a single read so every stage works on
+the same data, and only decodes text when a stage actually needs it.
+"""
+
+import hashlib
+import os
+
+# Size of the content sample passed to BaseModule.detect_game
+SAMPLE_SIZE = 2048
+
+
+class FileBuffer:
+    """
+    Raw content of a file, read once and shared across the open pipeline
+    """
+
+    def __init__(self, file_path, data, signature=None, encoding='utf-8'):
+        self.file_path = file_path
+        self.data = data
+        self.signature = signature
+        self.encoding = encoding
+        self._text = None
+        self._digest = None
+
+    @classmethod
+    def read(cls, file_path, encoding='utf-8'):
+        """
+        Read a file in a single call
+
+        The file's size and modification time are taken from the open handle,
+        so no extra stat round trip is needed (noticeable on network mounts).
+
+        Args:
+            file_path (str): Path to the file
+            encoding (str): Encoding used when text is requested
+
+        Returns:
+            FileBuffer: The file content
+        """
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        return cls(file_path, data, (stat.st_size, stat.st_mtime_ns), encoding)
+
+    def __len__(self):
+        return len(self.data)
+
+    def sample(self, size=SAMPLE_SIZE):
+        """Return the first bytes of the file decoded as text, for detection"""
+        return self.data[:size].decode(self.encoding, 'replace')
+
+    @property
+    def digest(self):
+        """SHA-1 hex digest of the content, computed on first access"""
+        if self._digest is None:
+            self._digest = hashlib.sha1(self.data).hexdigest()
+        return self._digest
+
+    @property
+    def text(self):
+        """The whole file decoded as text, decoded on first access"""
+        if self._text is None:
+            self._text = self.data.decode(self.encoding, 'replace')
+        return self._text
@@ -1,14 +1,34 @@
-import configparser
-import re
+from modules.base_module import BaseModule
+from modules.file_buffer import FileBuffer
+from modules.ini_document import IniDocument
+from modules.ini_tokenizer import iter_ini_records
+from modules.setting_def import DEFAULT_RANGES, SettingDef, SettingDefinitions
 
-class GenericModule:
+
+class IniSettingDef(SettingDef):
+    """
+    Definition of a key found in a generic .ini file
+    
+    The description is generated on demand instead of being stored per key.
+    """
+    
+    __slots__ = ()
+    
+    def _default_description(self):
+        option = self.name[len(self.section) + 1:]
+        return f"Setting '{option}' in section '{self.section}'"
+
+
+class GenericModule(BaseModule):
     """
     Generic module for handling any .ini file when a specific game module is not available.
     This module provides basic editing capabilities for .ini files without game-specific knowledge.
     """
     
     def __init__(self):
-        self._settings_cache = []
+        self._settings_cache = SettingDefinitions()
+        self._document = None
+        self._section_last_keys = {}
         
     def get_game_name(self):
         """Return a generic name for this module"""
@@ -22,163 +42,145 @@ class GenericModule:
         """Return all settings definitions"""
         return self._settings_cache
     
+    def get_definitions(self):
+        """Return the indexed settings definitions"""
+        return self._settings_cache
+    
+    def show_descriptions(self):
+        """Generated descriptions only repeat the key and section, so they are off by default"""
+        return False
+    
+    def saves_typed_values(self):
+        """save_ini_file encodes the values itself and only compares the modified ones"""
+        return True
+    
     def get_categories(self):
         """Return a list of categories (sections) from the .ini file"""
-        categories = set()
-        for setting in self._settings_cache:
-            if 'section' in setting:
-                categories.add(setting['section'])
-        
-        return sorted(list(categories))
+        return self._settings_cache.categories()
     
     def get_settings_by_category(self, category):
         """Return settings for a specific category (section)"""
-        return [s for s in self._settings_cache if s.get('section') == category]
+        return self._settings_cache.by_category(category)
     
     def get_default_settings(self):
-        """Return default values for all settings (empty since we don't know defaults)"""
-        defaults = {}
-        for setting in self._settings_cache:
-            defaults[setting['name']] = setting.get('default', '')
-        return defaults
+        """Return default values for all settings (the values found in the file)"""
+        return self._settings_cache.defaults()
     
-    def parse_ini_file(self, file_path):
+    def parse_ini_file(self, file_path, file_buffer=None):
         """
         Parse an .ini file and return its settings
         
         This detects the structure of the .ini file and creates setting definitions
-        dynamically based on what it finds in the file.
+        dynamically based on what it finds in the file. The file is read once and
+        tokenized in a single pass, so standard and non-standard (e.g. Unreal-style)
+        files go through the same code path.
         """
-        config = configparser.ConfigParser(allow_no_value=True, interpolation=None)
-        
-        # Preserve case of keys
-        config.optionxform = str
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                config.read_file(f)
-        except Exception as e:
-            # If standard parsing fails, try to read as a raw file
-            # and handle custom formats manually
+        if file_buffer is None:
             try:
-                return self._parse_custom_ini(file_path)
-            except Exception as e2:
-                raise ValueError(f"Failed to parse .ini file: {str(e2)}")
+                file_buffer = FileBuffer.read(file_path)
+            except OSError as e:
+                raise ValueError(f"Failed to parse .ini file: {str(e)}")
+        buffer = file_buffer.data
         
-        # Build settings data from parsed config
+        # Build settings data straight from the token stream
         settings_data = {}
-        self._settings_cache = []
-        
-        # For each section in the .ini file
-        for section in config.sections():
-            # For each option in the section
-            for option in config[section]:
-                value = config[section][option]
-                key_name = f"{section}.{option}"
-                
-                # Store the value
-                settings_data[key_name] = value
-                
-                # Determine the type of the value
+        self._settings_cache = definitions = SettingDefinitions()
+        self._document = document = IniDocument(buffer, file_path, signature=file_buffer.signature)
+        self._section_last_keys = section_last_keys = {}
+        
+        for section, option, value, span in iter_ini_records(buffer):
+            key_name = f"{section}.{option}"
+            
+            # Store the value and where it lives in the file
+            settings_data[key_name] = value
+            document.add_value(key_name, span)
+            section_last_keys[section] = key_name
+            
+            # Duplicate keys (e.g. Unreal arrays) keep their last value, and
+            # their type is the one of that value
+            setting_def = definitions.get(key_name)
+            if setting_def is not None:
+                setting_def.default = value
                 setting_type = self._determine_type(value)
-                
-                # Create a setting definition
-                setting_def = {
-                    'name': key_name,
-                    'section': section,
-                    'type': setting_type,
-                    'default': value,
-                    'description': f"Setting '{option}' in section '{section}'"
-                }
-                
-                # For numeric types, set reasonable min/max
-                if setting_type == 'integer':
-                    setting_def['min'] = -2147483647
-                    setting_def['max'] = 2147483647
-                elif setting_type == 'float':
-                    setting_def['min'] = -1000000.0
-                    setting_def['max'] = 1000000.0
-                
-                # Store the setting definition
-                self._settings_cache.append(setting_def)
+                if setting_type != setting_def.type:
+                    setting_def.type = setting_type
+                    setting_def.min, setting_def.max = DEFAULT_RANGES.get(setting_type, (None, None))
+                continue
+            
+            # Create a setting definition and store it
+            definitions.add(self._create_setting_def(key_name, section, value))
         
         return settings_data
     
-    def _parse_custom_ini(self, file_path):
-        """
-        Parse an .ini file that doesn't conform to the standard format
-        This is a fallback for files that configparser can't handle
+    def get_parse_state(self):
         """
-        settings_data = {}
-        self._settings_cache = []
+        Return the parse result in a compact form for the parse cache
         
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        Each key is stored as one row of (section index, option, type, value span);
+        values are read back from the file buffer on restore and the inferred
+        type saves running type detection again.
+        """
+        if self._document is None:
+            return None
         
-        # Try to identify sections and key-value pairs
-        # This is a simplified parser for non-standard .ini files
-        current_section = "General"
+        sections = {}
+        rows = []
+        for setting in self._settings_cache:
+            section = setting.section
+            start, end = self._document.span(setting.name)
+            option = setting.name[len(section) + 1:]
+            rows.append([sections.setdefault(section, len(sections)), option, setting.type, start, end])
         
-        # First, look for sections [SectionName]
-        section_matches = re.finditer(r'\[([^\]]+)\]', content)
-        section_positions = [(m.group(1), m.start(), m.end()) for m in section_matches]
+        return {
+            'sections': list(sections),
+            'rows': rows,
+            'section_last_keys': self._section_last_keys,
+        }
+    
+    def restore_parse_state(self, state, file_path, file_buffer):
+        """
+        Restore a cached parse of an unchanged file without tokenizing it again
         
-        # If no sections found, treat the whole file as "General" section
-        if not section_positions:
-            section_positions = [("General", 0, 0)]
+        The types are cached, so the definitions are created directly instead
+        of going through _create_setting_def.
+        """
+        buffer = file_buffer.data
+        encoding = 'utf-8'
+        sections = state['sections']
+        settings_data = {}
+        self._settings_cache = definitions = SettingDefinitions()
+        self._section_last_keys = state['section_last_keys']
+        self._document = document = IniDocument(buffer, file_path, encoding, file_buffer.signature)
+        add_value = document.add_value
+        add_definition = definitions.add
         
-        # Process each section
-        for i, (section, start, end) in enumerate(section_positions):
-            # Determine the end of the section
-            next_start = section_positions[i+1][1] if i+1 < len(section_positions) else len(content)
-            section_content = content[end:next_start]
+        for section_index, option, setting_type, start, end in state['rows']:
+            section = sections[section_index]
+            key_name = f"{section}.{option}"
+            value = buffer[start:end].decode(encoding, 'replace')
             
-            # Look for key-value pairs (KEY=VALUE)
-            for line in section_content.split('\n'):
-                line = line.strip()
-                if not line or line.startswith('#') or line.startswith(';'):
-                    continue
-                
-                # Try to split on = or :
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                elif ':' in line:
-                    key, value = line.split(':', 1)
-                else:
-                    continue
-                
-                key = key.strip()
-                value = value.strip()
-                key_name = f"{section}.{key}"
-                
-                # Store the value
-                settings_data[key_name] = value
-                
-                # Determine the type of the value
-                setting_type = self._determine_type(value)
-                
-                # Create a setting definition
-                setting_def = {
-                    'name': key_name,
-                    'section': section,
-                    'type': setting_type,
-                    'default': value,
-                    'description': f"Setting '{key}' in section '{section}'"
-                }
-                
-                # For numeric types, set reasonable min/max
-                if setting_type == 'integer':
-                    setting_def['min'] = -2147483647
-                    setting_def['max'] = 2147483647
-                elif setting_type == 'float':
-                    setting_def['min'] = -1000000.0
-                    setting_def['max'] = 1000000.0
-                
-                # Store the setting definition
-                self._settings_cache.append(setting_def)
+            settings_data[key_name] = value
+            add_value(key_name, (start, end))
+            
+            min_val, max_val = DEFAULT_RANGES.get(setting_type, (None, None))
+            add_definition(IniSettingDef(key_name, setting_type, value, section, section,
+                                         min=min_val, max=max_val))
         
         return settings_data
     
+    def _create_setting_def(self, key_name, section, value, setting_type=None):
+        """Create a setting definition for a key found in the .ini file"""
+        # Determine the type of the value unless it is already known
+        if setting_type is None:
+            setting_type = self._determine_type(value)
+        
+        # For numeric types, set reasonable min/max
+        min_val, max_val = DEFAULT_RANGES.get(setting_type, (None, None))
+        
+        # Sections double as categories
+        return IniSettingDef(key_name, setting_type, value, category=section, section=section,
+                             min=min_val, max=max_val)
+    
     def _determine_type(self, value):
         """Determine the type of a value from the .ini file"""
         value = value.strip()
@@ -208,30 +210,92 @@ class GenericModule:
         """
         Save settings to an .ini file
         
+        Only values that differ from the file are patched; comments, ordering
+        and formatting are kept. The settings cache is updated in place.
+        If settings is a ValueStore whose values were read from this module's
+        document, only the settings modified since are compared with the file.
+        
         Args:
             file_path (str): Path to the .ini file
             settings (dict): Dictionary of setting names to their values
         """
-        # Organize settings by section
-        sections = {}
-        for key, value in settings.items():
-            if '.' in key:
-                section, option = key.split('.', 1)
-                if section not in sections:
-                    sections[section] = {}
-                sections[section][option] = value
-        
-        # Create a new configparser
-        config = configparser.ConfigParser(allow_no_value=True, interpolation=None)
-        config.optionxform = str  # Preserve case
-        
-        # Add all the sections and options
-        for section, options in sections.items():
-            config[section] = options
-        
-        # Write to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            config.write(f)
-        
-        # Refresh settings cache based on the file
-        self.parse_ini_file(file_path) 
\ No newline at end of file
+        # Start from the file on disk if it was never parsed or changed since
+        keys = settings.keys()
+        if self._document is None or not self._document.is_current(file_path):
+            self.parse_ini_file(file_path)
+        elif hasattr(settings, 'modified_keys'):
+            keys = settings.modified_keys()
+        document = self._document
+        
+        changed = {}
+        new_sections = {}
+        codecs = self.get_codecs()
+        for key in keys:
+            if key not in settings:
+                continue
+            value = settings[key]
+            codec = codecs.for_setting(self._settings_cache.get(key))
+            if key in document.spans:
+                text = codec.encode(value, document.get_raw(key))
+                if document.set_raw(key, text):
+                    changed[key] = text
+            else:
+                text = codec.encode(value)
+                section, option = self._split_key(key)
+                if section in self._section_last_keys:
+                    self._insert_option(section, option, key, text)
+                else:
+                    new_sections.setdefault(section, []).append((option, key, text))
+                changed[key] = text
+        
+        # Keys in sections the file doesn't have yet go into new sections at the end
+        if new_sections:
+            self._append_sections(new_sections)
+        
+        document.save(file_path)
+        
+        # Refresh the settings cache in place instead of reparsing
+        for key, text in changed.items():
+            setting_def = self._settings_cache.get(key)
+            if setting_def is not None:
+                setting_def.default = text
+            else:
+                section, _option = self._split_key(key)
+                self._settings_cache.add(self._create_setting_def(key, section, text))
+                self._section_last_keys[section] = key
+    
+    def _split_key(self, key):
+        """Split a 'Section.option' key, preferring the longest known section name"""
+        best = None
+        for section in self._section_last_keys:
+            if key.startswith(section + '.') and (best is None or len(section) > len(best)):
+                best = section
+        if best is not None:
+            return best, key[len(best) + 1:]
+        if '.' in key:
+            return tuple(key.split('.', 1))
+        return "General", key
+    
+    def _insert_option(self, section, option, key, text):
+        """Queue a new option after the last key of an existing section"""
+        document = self._document
+        newline = document.newline.decode()
+        last_value_end = document.span(self._section_last_keys[section])[1]
+        line_end = document.buffer.find(b'\n', last_value_end)
+        if line_end == -1:
+            document.insert_value(key, len(document.buffer), f"{newline}{option}=", text)
+        else:
+            document.insert_value(key, line_end + 1, f"{option}=", text, newline)
+    
+    def _append_sections(self, new_sections):
+        """Queue new sections and their options at the end of the file"""
+        document = self._document
+        newline = document.newline.decode()
+        offset = len(document.buffer)
+        lead = '' if not document.buffer or document.buffer.endswith(b'\n') else newline
+        for section, options in new_sections.items():
+            header = f"{lead}{newline if offset else ''}[{section}]{newline}"
+            for index, (option, key, text) in enumerate(options):
+                prefix = (header if index == 0 else '') + f"{option}="
+                document.insert_value(key, offset, prefix, text, newline)
+            lead = ''
@@ -0,0 +1,228 @@
+"""
+Lossless document model for .ini files.
+
+An IniDocument keeps the original bytes of a file untouched together with the
+byte span of every value. Edits are recorded as patches against those spans, so
+saving only rewrites what changed and comments, ordering and formatting survive.
+
+A save that changes the length of the file doesn't move every span: it records
+how positions shift, and a span is only moved when it is looked up again.
+"""
+
+import os
+from bisect import bisect_left
+
+
+class IniDocument:
+    """
+    In-memory model of an .ini file that preserves the original bytes
+    """
+
+    def __init__(self, buffer, file_path=None, encoding='utf-8', signature=None):
+        # Mutable, so equal-length edits are saved without copying the buffer
+        self.buffer = bytearray(buffer)
+        self.file_path = file_path
+        self.encoding = encoding
+        self.newline = b'\r\n' if b'\r\n' in self.buffer[:4096] else b'\n'
+
+        # key -> (start, end) of the raw value, as of the save it was last
+        # moved by; span() returns the current position
+        self.spans = {}
+
+        # Shifts of the saves that changed the length of the file, oldest first:
+        # (starts, deltas) lists where a position past starts[i] moves by deltas[i]
+        self._shifts = []
+        # key -> number of shifts already applied to its span (0 if missing)
+        self._span_shifts = {}
+
+        # Pending edits: key -> new raw bytes for existing values,
+        # and a list of (offset, data, key, value_offset, value_length) for inserted values
+        self._patches = {}
+        self._inserts = []
+
+        # (size, mtime_ns) of the file the buffer was read from
+        if signature is None and file_path:
+            signature = self._stat_signature(file_path)
+        self.signature = signature
+
+    @staticmethod
+    def _stat_signature(file_path):
+        """Return the (size, mtime_ns) pair used to detect changes on disk"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def is_current(self, file_path):
+        """Check that the file on disk is still the one this document was built from"""
+        if self.file_path is None or os.path.abspath(file_path) != os.path.abspath(self.file_path):
+            return False
+        return self.signature is not None and self._stat_signature(file_path) == self.signature
+
+    def add_value(self, key, span):
+        """Register the byte span of a value; later occurrences of a key win"""
+        self.spans[key] = span
+        if self._shifts:
+            self._span_shifts[key] = len(self._shifts)
+
+    def span(self, key):
+        """Return the current (start, end) of a value in the buffer"""
+        start, end = self.spans[key]
+        applied = self._span_shifts.get(key, 0)
+        if applied < len(self._shifts):
+            for starts, deltas in self._shifts[applied:]:
+                index = bisect_left(starts, start)
+                if index:
+                    start += deltas[index - 1]
+                    end += deltas[index - 1]
+            self.spans[key] = (start, end)
+            self._span_shifts[key] = len(self._shifts)
+        return start, end
+
+    def get_raw(self, key):
+        """Return the current raw text of a value, including pending edits"""
+        if key in self._patches:
+            return self._patches[key].decode(self.encoding, 'replace')
+        start, end = self.span(key)
+        return self.buffer[start:end].decode(self.encoding, 'replace')
+
+    def set_raw(self, key, text):
+        """
+        Record a new raw value for an existing key
+
+        Returns:
+            bool: True if the value differs from the one in the file
+        """
+        data = text.encode(self.encoding)
+        start, end = self.span(key)
+        if self.buffer[start:end] == data:
+            self._patches.pop(key, None)
+            return False
+        self._patches[key] = data
+        return True
+
+    def insert_value(self, key, offset, prefix, text, suffix=''):
+        """
+        Record a new value to be inserted at a byte offset
+
+        Args:
+            key (str): Key the inserted value belongs to
+            offset (int): Byte offset in the original buffer
+            prefix (str): Text written before the value (e.g. "Key=")
+            text (str): The raw value
+            suffix (str): Text written after the value (e.g. a newline)
+        """
+        prefix_data = prefix.encode(self.encoding)
+        data = prefix_data + text.encode(self.encoding) + suffix.encode(self.encoding)
+        self._inserts.append((offset, data, key, len(prefix_data), len(text.encode(self.encoding))))
+
+    def is_modified(self):
+        """Return True if there are edits that have not been saved yet"""
+        return bool(self._patches or self._inserts)
+
+    def discard_changes(self):
+        """Drop all pending edits"""
+        self._patches = {}
+        self._inserts = []
+
+    def _pending_edits(self):
+        """Return pending edits as sorted (start, end, data, key, value_offset, value_length) tuples"""
+        edits = []
+        for key, data in self._patches.items():
+            start, end = self.span(key)
+            edits.append((start, end, data, key, 0, len(data)))
+        for offset, data, key, value_offset, value_length in self._inserts:
+            edits.append((offset, offset, data, key, value_offset, value_length))
+        edits.sort(key=lambda edit: (edit[0], edit[1]))
+        return edits
+
+    def render(self, edits=None):
+        """Return the document content with all pending edits applied"""
+        if edits is None:
+            edits = self._pending_edits()
+        pieces = []
+        position = 0
+        for start, end, data, *_ in edits:
+            pieces.append(self.buffer[position:start])
+            pieces.append(data)
+            position = end
+        pieces.append(self.buffer[position:])
+        return bytearray().join(pieces)
+
+    def save(self, file_path):
+        """
+        Write pending edits to disk
+
+        When the target is the file this document was read from and it has not
+        changed on disk, only the edited region is rewritten: equal-length
+        patches are written in place (and applied to the buffer without
+        rendering it), otherwise the file is rewritten from the first edit
+        onwards. Any other target receives the full content.
+
+        Returns:
+            bool: True if anything was written
+        """
+        if not self.is_modified():
+            return False
+
+        edits = self._pending_edits()
+        in_place = all(end - start == len(data) for start, end, data, *_ in edits)
+        new_buffer = None
+
+        if self.is_current(file_path):
+            with open(file_path, 'r+b') as f:
+                if in_place:
+                    for start, _end, data, *_ in edits:
+                        f.seek(start)
+                        f.write(data)
+                else:
+                    new_buffer = self.render(edits)
+                    first = edits[0][0]
+                    f.seek(first)
+                    f.write(memoryview(new_buffer)[first:])
+                    f.truncate()
+        else:
+            new_buffer = self.render(edits)
+            with open(file_path, 'wb') as f:
+                f.write(new_buffer)
+
+        self._commit(edits, new_buffer)
+        self.file_path = file_path
+        self.signature = self._stat_signature(file_path)
+        return True
+
+    def _commit(self, edits, new_buffer=None):
+        """
+        Adopt the saved content and record how it shifted the spans past an edit
+
+        Args:
+            edits (list): The saved edits, see _pending_edits
+            new_buffer (bytearray, optional): The rendered content; equal-length
+                edits are applied to the buffer in place if omitted
+        """
+        if new_buffer is None:
+            for start, end, data, *_ in edits:
+                self.buffer[start:end] = data
+        else:
+            self.buffer = new_buffer
+
+        starts = []
+        deltas = []
+        total = 0
+        for start, end, data, *_ in edits:
+            starts.append(start)
+            total += len(data) - (end - start)
+            deltas.append(total)
+        if any(deltas):
+            self._shifts.append((starts, deltas))
+
+        # The edited values get their new spans right away
+        for index, (start, end, data, key, value_offset, value_length) in enumerate(edits):
+            shift = deltas[index - 1] if index else 0
+            value_start = start + shift + value_offset
+            self.spans[key] = (value_start, value_start + value_length)
+            if self._shifts:
+                self._span_shifts[key] = len(self._shifts)
+
+        self.discard_changes()
@@ -0,0 +1,209 @@
+"""
+Streaming tokenizer for .ini files.
+
+The tokenizer works directly on the raw bytes of a file, so the file only has
+to be read once and is never copied as a whole. Records are produced lazily,
+one per key, together with the byte span of the value in the buffer.
+
+It also contains a scanner for Unreal-style struct values such as
+``OptionSettings=(Key=Value,...)``, which may span many lines and contain
+nested tuples and quoted strings with commas.
+"""
+
+import re
+
+# Section used for keys that appear before the first [Section] header
+DEFAULT_SECTION = "General"
+
+# Characters that start a full-line comment
+COMMENT_PREFIXES = (b'#', b';')
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Structural characters of a struct value and of a quoted string. Searching for
+# a single character class lets the scanner jump over plain text without
+# backtracking, so scanning stays linear in the size of the struct.
+STRUCT_TOKENS = re.compile(rb'[,()"=]')
+QUOTE_TOKENS = re.compile(rb'["\\]')
+
+STRUCT_SEPARATORS = b' \t\r\n,'
+
+
+def iter_ini_records(buffer, encoding='utf-8', default_section=DEFAULT_SECTION):
+    """
+    Tokenize an .ini buffer in a single pass
+
+    Handles standard files as well as the non-standard variants configparser
+    rejects (keys before the first section, duplicate keys, Unreal-style
+    ``+Key=Value`` arrays, ``key: value`` pairs). Lines without a delimiter
+    and full-line comments are skipped.
+
+    Args:
+        buffer (bytes): Raw file content (any object supporting find/slicing, e.g. mmap)
+        encoding (str): Encoding used to decode section names, keys and values
+        default_section (str): Section assigned to keys before the first header
+
+    Yields:
+        tuple: (section, key, value, byte_span) where byte_span is the
+            (start, end) offset of the value in the buffer
+    """
+    length = len(buffer)
+    pos = len(UTF8_BOM) if buffer[:len(UTF8_BOM)] == UTF8_BOM else 0
+    section = default_section
+
+    while pos < length:
+        eol = buffer.find(b'\n', pos)
+        if eol == -1:
+            eol = length
+        line = buffer[pos:eol]
+        line_start = pos
+        pos = eol + 1
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith(COMMENT_PREFIXES):
+            continue
+
+        # Section header [SectionName]
+        if stripped.startswith(b'['):
+            close = stripped.find(b']')
+            if close > 1:
+                section = stripped[1:close].decode(encoding, 'replace').strip()
+            continue
+
+        # Key-value pair, split on whichever of '=' and ':' comes first
+        delimiters = [index for index in (line.find(b'='), line.find(b':')) if index != -1]
+        if not delimiters:
+            continue
+        delimiter = min(delimiters)
+
+        key = line[:delimiter].strip()
+        if not key:
+            continue
+
+        # The span never includes the '\r' of a CRLF line, so patching an
+        # empty value keeps the line ending intact
+        raw_value = line[delimiter + 1:].rstrip(b'\r')
+        value = raw_value.strip()
+        value_start = line_start + delimiter + 1
+        if value:
+            value_start += len(raw_value) - len(raw_value.lstrip())
+        value_end = value_start + len(value)
+
+        yield (
+            section,
+            key.decode(encoding, 'replace'),
+            value.decode(encoding, 'replace'),
+            (value_start, value_end),
+        )
+
+
+def find_struct(buffer, key):
+    """
+    Find an Unreal-style struct assignment such as ``OptionSettings=(``
+
+    Args:
+        buffer (bytes): Raw file content
+        key (str): Name of the struct key
+
+    Returns:
+        int: Offset just after the opening parenthesis, or -1 if not found
+    """
+    needle = key.encode('ascii') + b'=('
+    index = buffer.find(needle)
+    return -1 if index == -1 else index + len(needle)
+
+
+def scan_struct(buffer, start, encoding='utf-8'):
+    """
+    Scan the fields of a struct value in a single pass
+
+    Quoted strings may contain commas and parentheses, and values may be
+    nested tuples like ``CrossplayPlatforms=(Steam,Xbox,PS5,Mac)``; both are
+    returned verbatim. Quotes are kept in the returned values, use
+    unquote_value() to strip them.
+
+    Args:
+        buffer (bytes): Raw file content
+        start (int): Offset just after the struct's opening parenthesis
+        encoding (str): Encoding used to decode keys and values
+
+    Returns:
+        tuple: (fields, end) where fields is a list of (key, value, byte_span)
+            tuples and end is the offset of the closing parenthesis
+
+    Raises:
+        ValueError: If the struct is not terminated
+    """
+    length = len(buffer)
+    fields = []
+    pos = start
+
+    while True:
+        # Skip separators between fields
+        while pos < length and buffer[pos] in STRUCT_SEPARATORS:
+            pos += 1
+        if pos >= length:
+            raise ValueError("Unterminated struct value")
+        if buffer[pos] == 0x29:  # ')'
+            return fields, pos
+
+        # Key runs up to '='; a field without one is skipped as a bare value
+        match = STRUCT_TOKENS.search(buffer, pos)
+        if match is None:
+            raise ValueError("Unterminated struct value")
+        if match.group() == b'=':
+            key = buffer[pos:match.start()].strip()
+            pos = match.end()
+        else:
+            key = None
+
+        # Value runs up to the next top-level ',' or ')'
+        while pos < length and buffer[pos] in b' \t':
+            pos += 1
+        value_start = pos
+        depth = 0
+        while True:
+            match = STRUCT_TOKENS.search(buffer, pos)
+            if match is None:
+                raise ValueError("Unterminated struct value")
+            token = match.group()
+            pos = match.end()
+            if token == b'"':
+                pos = _skip_quoted(buffer, pos)
+            elif token == b'(':
+                depth += 1
+            elif token == b')':
+                if depth == 0:
+                    pos = match.start()
+                    break
+                depth -= 1
+            elif token == b',' and depth == 0:
+                pos = match.start()
+                break
+
+        value = buffer[value_start:pos].rstrip()
+        if key:
+            fields.append((
+                key.decode(encoding, 'replace'),
+                value.decode(encoding, 'replace'),
+                (value_start, value_start + len(value)),
+            ))
+
+
+def _skip_quoted(buffer, pos):
+    """Return the offset just after the closing quote of a string starting at pos"""
+    while True:
+        match = QUOTE_TOKENS.search(buffer, pos)
+        if match is None:
+            raise ValueError("Unterminated quoted string")
+        if match.group() == b'"':
+            return match.end()
+        # Backslash escapes the next character
+        pos = match.end() + 1
+
+
+def unquote_value(value):
+    """Strip the surrounding double quotes from a struct value, if present"""
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1]
+    return value
@@ -1,30 +1,63 @@
 import os
 import re
+import inspect
 from pathlib import Path
 import importlib.util
 
+from modules.file_buffer import FileBuffer
+from modules.generic_module import GenericModule
+from modules.module_manifest import ModuleManifest
+from modules.value_store import ValueStore
+
+class LoadCancelled(Exception):
+    """Raised by a progress callback to stop loading a file"""
+
 class ModuleLoader:
     """
     Class responsible for detecting game type from .ini files and loading the appropriate module
     """
     
-    def __init__(self):
+    def __init__(self, parse_cache=None):
+        # Optional persistent cache of parse results (see modules.parse_cache)
+        self.parse_cache = parse_cache
+        
         # Path to the modules directory
         self.modules_dir = os.path.dirname(os.path.abspath(__file__))
         
-        # Dictionary to store loaded modules
+        # Manifests of the modules that are imported when a file matches them
+        self.manifests = {}
+        
+        # Instances of the modules without a manifest, loaded at startup
         self.modules = {}
         
-        # Load all available modules
+        # Instances of the imported manifest modules returned by get_all_modules
+        self._manifest_modules = {}
+        
+        # Find all available modules
         self.discover_modules()
     
     def discover_modules(self):
-        """Discover all available game modules in the modules directory"""
-        for item in os.listdir(self.modules_dir):
+        """
+        Discover all available game modules in the modules directory
+        
+        Only the manifests of the modules are read; a module with a manifest is
+        imported when the first file matching it is opened. Modules without a
+        manifest are loaded right away and detect their files themselves.
+        """
+        for item in sorted(os.listdir(self.modules_dir)):
             module_path = os.path.join(self.modules_dir, item)
             
             # Check if it's a directory and contains a module.py file
             if os.path.isdir(module_path) and item != '__pycache__':
+                try:
+                    manifest = ModuleManifest.load(module_path)
+                except (OSError, ValueError) as e:
+                    print(f"Error reading manifest of module {item}: {str(e)}")
+                    continue
+                if manifest is not None:
+                    self.manifests[item] = manifest
+                    continue
+                
                 module_file = os.path.join(module_path, 'module.py')
                 if os.path.isfile(module_file):
                     try:
@@ -57,33 +90,175 @@ class ModuleLoader:
             raise
     
     def get_all_modules(self):
-        """Return all loaded modules"""
-        return self.modules
+        """Return all loaded modules; modules with a manifest are only included once imported"""
+        modules = dict(self.modules)
+        for module_name, manifest in self.manifests.items():
+            if manifest.is_loaded:
+                if module_name not in self._manifest_modules:
+                    self._manifest_modules[module_name] = manifest.module_class()()
+                modules[module_name] = self._manifest_modules[module_name]
+        return modules
     
-    def detect_game_from_file(self, file_path):
+    def open_file(self, file_path, progress=None):
         """
-        Detect the game type from an .ini file and return the appropriate module
-        Returns a tuple of (game_name, module_instance) or (None, None) if no match
+        Read an .ini file once, detect its game and parse it with the matching module
+        
+        The same buffer is used for detection and parsing, so the file is only read once.
+        If a parse cache is configured and holds a valid entry for the file, parsing is
+        skipped entirely.
+        Each file is parsed by a new instance of its module, so loading a file (e.g. in a
+        background thread) never changes the state of the module editing another file.
+        
+        Args:
+            file_path (str): Path of the file
+            progress (callable, optional): Called as progress(message, percent) before each
+                step; it may raise LoadCancelled to stop loading
+        
+        Returns a tuple of (game_name, module_instance, settings_data); game_name is None
+        when no specific module matched and the generic module was used. settings_data is
+        a ValueStore holding the values decoded with the module's codecs
         """
+        if progress is None:
+            progress = lambda message, percent: None
+        
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        progress("Reading file", 0)
+        file_buffer = FileBuffer.read(file_path)
+        
+        progress("Detecting game", 20)
+        game_name, module_class = self.detect_module_class(file_path, file_buffer)
+        module = GenericModule() if module_class is None else module_class()
+        
+        progress("Parsing settings", 30)
+        cached = self._load_cached(module, file_path, file_buffer)
+        if cached is None:
+            settings_data = self.parse_file(module, file_path, file_buffer)
+            decoded = None
+        else:
+            settings_data, decoded = cached
+        
+        # Decode every value once, with the type from its definition; the
+        # cache holds the values already decoded
+        progress("Decoding values", 70)
+        codecs = module.get_codecs() if hasattr(module, 'get_codecs') else None
+        settings_data = ValueStore.from_raw(settings_data, module.get_definitions(), codecs,
+                                            keep_text=not self.saves_typed_values(module),
+                                            decoded=decoded)
+        if cached is None:
+            self._store_cached(module, file_path, file_buffer, settings_data)
+        return game_name, module, settings_data
+    
+    def _load_cached(self, module, file_path, file_buffer):
+        """
+        Restore a module's parse state from the cache
+        
+        Returns:
+            tuple: (raw values, decoded values in the same order), or None on a miss
+        """
+        if self.parse_cache is None:
+            return None
+        
+        entry = self.parse_cache.get(file_path, file_buffer, module.get_game_name())
+        if entry is None:
+            return None
+        
+        try:
+            settings_data = module.restore_parse_state(entry['state'], file_path, file_buffer)
+            decoded = entry['values']
+        except Exception as e:
+            print(f"Ignoring unusable parse cache entry for {file_path}: {str(e)}")
+            return None
+        if settings_data is None or len(decoded) != len(settings_data):
+            return None
+        return settings_data, decoded
+    
+    def _store_cached(self, module, file_path, file_buffer, settings_data):
+        """Store a module's parse state and the decoded values in the cache, if the module supports it"""
+        if self.parse_cache is None or not hasattr(module, 'get_parse_state'):
+            return
+        
+        state = module.get_parse_state()
+        if state is None:
+            return
+        
+        try:
+            self.parse_cache.put(file_path, file_buffer, module.get_game_name(),
+                                 {'state': state, 'values': list(settings_data.values())})
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not cache parse result for {file_path}: {str(e)}")
+    
+    def saves_typed_values(self, module):
+        """Return True if a module's save_ini_file takes typed values, see BaseModule.saves_typed_values"""
+        return hasattr(module, 'saves_typed_values') and module.saves_typed_values()
+    
+    def save_file(self, module, file_path, settings):
+        """
+        Save a file with a module
+        
+        Modules that don't take typed values are given the values as text,
+        as they were before values were decoded.
+        
+        Args:
+            module: Module the file was opened with
+            file_path (str): Path of the file
+            settings (ValueStore): Values of the file
+        """
+        if not self.saves_typed_values(module):
+            settings = settings.to_text()
+        module.save_ini_file(file_path, settings)
+    
+    def parse_file(self, module, file_path, file_buffer):
+        """Parse a file with a module, sharing the buffer if the module accepts it"""
+        if 'file_buffer' in inspect.signature(module.parse_ini_file).parameters:
+            return module.parse_ini_file(file_path, file_buffer=file_buffer)
+        return module.parse_ini_file(file_path)
+    
+    def detect_game_from_file(self, file_path, file_buffer=None):
+        """
+        Detect the game type from an .ini file and return the appropriate module
+        Returns a tuple of (game_name, module_instance) or (None, None) if no match
+        """
+        game_name, module_class = self.detect_module_class(file_path, file_buffer)
+        if module_class is None:
+            return None, None
+        return game_name, module_class()
+    
+    def detect_module_class(self, file_path, file_buffer=None):
+        """
+        Detect the game type from an .ini file and return the class of its module
+        
+        Manifests are matched first; only the module of the matching manifest
+        is imported. Modules without a manifest are asked through detect_game.
+        
+        Returns a tuple of (game_name, module_class) or (None, None) if no match
+        """
+        if file_buffer is None:
+            if not os.path.isfile(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            file_buffer = FileBuffer.read(file_path)
+        
         # Get the file name and directory
         file_name = os.path.basename(file_path)
         dir_name = os.path.dirname(file_path)
         
-        # Read the first few lines of the file to check content
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            try:
-                content_sample = f.read(2048)  # Read first 2KB for pattern matching
-            except Exception:
-                content_sample = ""
+        # Decode only the first 2KB of the shared buffer for pattern matching
+        content_sample = file_buffer.sample()
+        
+        # Match the manifests without importing their modules
+        for module_name, manifest in self.manifests.items():
+            if manifest.matches(file_path, file_name, dir_name, content_sample):
+                try:
+                    return manifest.name, manifest.module_class()
+                except Exception as e:
+                    print(f"Error loading module {module_name}: {str(e)}")
         
-        # Try each module's detection rules
+        # Try each loaded module's detection rules
         for module_name, module in self.modules.items():
             if hasattr(module, 'detect_game') and callable(module.detect_game):
                 if module.detect_game(file_path, file_name, dir_name, content_sample):
-                    return module.get_game_name(), module
+                    return module.get_game_name(), type(module)
         
         # No specific module detected
         return None, None 
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""
+Manifests describing game modules without importing them.
+
+Each game module directory can ship a small ``manifest.json`` with the game's
+name, the module file and class, and the signatures that identify its files:
+
+    {
+        "name": "Palworld",
+        "module": "module.py",
+        "class": "GameModule",
+        "signatures": [
+            {"content_pattern": "OptionSettings=\\("},
+            {"file_name": "PalWorldSettings.ini"},
+            {"dir_contains": ["palworld"], "content_contains": ["ExpRate"]}
+        ]
+    }
+
+A file matches a manifest when all conditions of one of its signatures hold:
+
+    content_pattern   Regular expression found in the first 2KB of the file
+    file_name         File name, ignoring case
+    dir_contains      One of these texts is part of the directory name, ignoring case
+    content_contains  One of these texts occurs in the first 2KB of the file
+
+The module loader only reads manifests at startup. The module itself is
+imported the first time a file matches, so startup doesn't grow with the
+number or size of the game modules.
+"""
+
+import importlib.util
+import json
+import os
+import re
+import threading
+
+MANIFEST_FILE = 'manifest.json'
+
+SIGNATURE_KEYS = ('content_pattern', 'file_name', 'dir_contains', 'content_contains')
+
+
+class Signature:
+    """
+    Conditions that together identify a module's file
+    """
+
+    __slots__ = ('content_pattern', 'file_name', 'dir_contains', 'content_contains')
+
+    def __init__(self, content_pattern=None, file_name=None, dir_contains=None, content_contains=None):
+        self.content_pattern = None if content_pattern is None else re.compile(content_pattern)
+        self.file_name = None if file_name is None else file_name.lower()
+        self.dir_contains = None if dir_contains is None else [text.lower() for text in dir_contains]
+        self.content_contains = content_contains
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a signature from a manifest dictionary"""
+        unknown = set(data) - set(SIGNATURE_KEYS)
+        if unknown or not data:
+            raise ValueError(f"Invalid signature: {data!r}")
+        return cls(**data)
+
+    def matches(self, file_name, dir_name, content_sample):
+        """Return True if every condition of the signature holds"""
+        if self.file_name is not None and file_name.lower() != self.file_name:
+            return False
+        if self.dir_contains is not None:
+            dir_basename = os.path.basename(dir_name).lower()
+            if not any(text in dir_basename for text in self.dir_contains):
+                return False
+        if self.content_contains is not None:
+            if not any(text in content_sample for text in self.content_contains):
+                return False
+        if self.content_pattern is not None and not self.content_pattern.search(content_sample):
+            return False
+        return True
+
+
+class ModuleManifest:
+    """
+    A game module known by its manifest; the module is imported on first use
+
+    Args:
+        module_dir (str): Directory of the module
+        name (str): Name of the game
+        signatures (list): Signature objects identifying the game's files
+        module_file (str): File of the module, relative to module_dir
+        class_name (str): Name of the module class in that file
+    """
+
+    def __init__(self, module_dir, name, signatures, module_file='module.py', class_name='GameModule'):
+        self.module_dir = module_dir
+        self.name = name
+        self.signatures = signatures
+        self.module_file = module_file
+        self.class_name = class_name
+        self._module_class = None
+        # Files are loaded in worker threads; a module is imported only once
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, module_dir):
+        """
+        Read the manifest of a module directory
+
+        Returns:
+            ModuleManifest: The manifest, or None if the directory has none
+
+        Raises:
+            ValueError: If the manifest is not valid
+        """
+        path = os.path.join(module_dir, MANIFEST_FILE)
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        try:
+            signatures = [Signature.from_dict(signature) for signature in data.get('signatures', [])]
+            return cls(module_dir, data['name'], signatures,
+                       data.get('module', 'module.py'), data.get('class', 'GameModule'))
+        except (KeyError, TypeError, re.error) as e:
+            raise ValueError(f"Invalid manifest {path}: {str(e)}")
+
+    def matches(self, file_path, file_name, dir_name, content_sample):
+        """
+        Return True if a file belongs to this module, with the arguments of BaseModule.detect_game
+        """
+        return any(signature.matches(file_name, dir_name, content_sample) for signature in self.signatures)
+
+    @property
+    def is_loaded(self):
+        """True once the module has been imported"""
+        return self._module_class is not None
+
+    def module_class(self):
+        """Import the module the first time and return its class"""
+        with self._lock:
+            if self._module_class is None:
+                self._module_class = self._import_class()
+        return self._module_class
+
+    def _import_class(self):
+        """Import the module file and return its module class"""
+        module_name = os.path.basename(self.module_dir)
+        spec = importlib.util.spec_from_file_location(
+            module_name, os.path.join(self.module_dir, self.module_file))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if not hasattr(module, self.class_name):
+            raise ImportError(f"Module {module_name} does not have a {self.class_name} class")
+        return getattr(module, self.class_name)
+
+    def __repr__(self):
+        return f"ModuleManifest({self.name!r}, loaded={self.is_loaded})"
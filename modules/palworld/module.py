@@ -1,7 +1,6 @@
-import configparser
 import os
 import json
-import re
+import hashlib
 from pathlib import Path
 import sys
 import time
@@ -10,12 +9,24 @@ from datetime import datetime
 # Add parent directory to path for importing base module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from base_module import BaseModule
+from file_buffer import FileBuffer
+from ini_document import IniDocument
+from ini_tokenizer import find_struct, iter_ini_records, scan_struct, unquote_value
+from module_manifest import ModuleManifest
+from setting_def import SettingDefinitions
+from value_codecs import DEFAULT_CODECS, FloatCodec
+
+# Palworld writes floats with six decimals
+PALWORLD_CODECS = DEFAULT_CODECS.copy(float=FloatCodec(precision=6))
 
 class GameModule(BaseModule):
     """
     Palworld game module that defines settings specific to Palworld.
     """
     
+    # manifest.json, read by the first detect_game call
+    _manifest = None
+    
     def __init__(self):
         # Load the settings definitions
         module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -24,23 +35,41 @@ class GameModule(BaseModule):
         
         try:
             with open(settings_json_path, 'r', encoding='utf-8') as f:
-                self.settings_definitions = json.load(f)
+                settings = json.load(f)
         except FileNotFoundError:
             # If settings.json doesn't exist, use hardcoded definitions
-            self.settings_definitions = self._get_hardcoded_settings()
+            settings = self._get_hardcoded_settings()
             
             # Save the hardcoded settings to a JSON file for future use
             try:
                 # Create settings.json if it doesn't exist
                 with open(settings_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.settings_definitions, f, indent=2)
+                    json.dump(settings, f, indent=2)
                 print(f"Created settings.json at {settings_json_path}")
             except Exception as e:
                 print(f"Warning: Could not save settings to JSON: {str(e)}")
         
-        # Compile regex patterns for performance
-        self.options_pattern = re.compile(r'OptionSettings=\((.*?)\)', re.DOTALL)
-        self.key_value_pattern = re.compile(r'(\w+)=(.*?)(?:,|\s*$)', re.DOTALL)
+        # settings.json is either a list of settings or an object with
+        # "settings" and cross-setting "rules"
+        self.rules = []
+        if isinstance(settings, dict):
+            self.rules = settings.get('rules', [])
+            settings = settings.get('settings', [])
+        
+        # String defaults are written quoted, as in the file; parsed values
+        # are unquoted, so the defaults are too
+        for setting in settings:
+            if setting.get('type') == 'string' and isinstance(setting.get('default'), str):
+                setting['default'] = unquote_value(setting['default'])
+        
+        # Index the definitions by name and category once
+        self.settings_definitions = SettingDefinitions.from_dicts(settings)
+        
+        # Document model of the last parsed file, used to patch values on save
+        self._document = None
+        self._content_hash = None
+        self._options_start = None
+        self._last_option_key = None
     
     def get_game_name(self):
         """Return the name of the game this module is for"""
@@ -50,130 +79,88 @@ class GameModule(BaseModule):
         """
         Detect if an .ini file is for Palworld
         
+        The signatures are those of manifest.json, which the module loader
+        matches without importing this module.
+        
         Returns:
             bool: True if the file is detected as belonging to Palworld, False otherwise
         """
-        # First try using a more efficient regex pattern for detection
-        palworld_patterns = [
-            r'/Script/Pal\.PalGameWorldSettings',
-            r'OptionSettings=\(',
-            r'DayTimeSpeedRate=[0-9\.]+',
-            r'PalCaptureRate=[0-9\.]+'
-        ]
-        
-        # Try to match any of the patterns
-        for pattern in palworld_patterns:
-            if re.search(pattern, content_sample):
-                return True
-        
-        # Check file name
-        if file_name.lower() == "palworldsettings.ini":
-            return True
-            
-        # Check directory name for clues
-        dir_basename = os.path.basename(dir_name).lower()
-        if "palworld" in dir_basename or "pal" in dir_basename:
-            # Look for common Palworld settings in content
-            common_settings = ["ExpRate", "DeathPenalty", "BaseCampMaxNum"]
-            for setting in common_settings:
-                if setting in content_sample:
-                    return True
-        
-        return False
+        if GameModule._manifest is None:
+            GameModule._manifest = ModuleManifest.load(self.module_dir)
+        return GameModule._manifest.matches(file_path, file_name, dir_name, content_sample)
     
     def get_all_settings(self):
         """Return all settings definitions"""
         return self.settings_definitions
     
+    def get_definitions(self):
+        """Return the indexed settings definitions"""
+        return self.settings_definitions
+    
+    def get_rules(self):
+        """Return the cross-setting rules from settings.json"""
+        return self.rules
+    
+    def get_codecs(self):
+        """Return the codecs for OptionSettings values"""
+        return PALWORLD_CODECS
+    
+    def saves_typed_values(self):
+        """save_ini_file formats the values itself, see _format_value"""
+        return True
+    
     def get_categories(self):
         """Return a list of categories for the settings"""
-        categories = set()
-        for setting in self.settings_definitions:
-            if 'category' in setting:
-                categories.add(setting['category'])
-        
-        return sorted(list(categories))
+        return self.settings_definitions.categories()
     
     def get_settings_by_category(self, category):
         """Return settings for a specific category"""
-        return [s for s in self.settings_definitions if s.get('category') == category]
+        return self.settings_definitions.by_category(category)
     
     def get_default_settings(self):
         """Return default values for all settings"""
-        defaults = {}
-        for setting in self.settings_definitions:
-            defaults[setting['name']] = setting.get('default', '')
-        return defaults
+        return self.settings_definitions.defaults()
     
-    def parse_ini_file(self, file_path):
+    def parse_ini_file(self, file_path, file_buffer=None):
         """
         Parse a Palworld .ini file and return its settings
         
         Palworld uses a custom format that's not standard .ini, so we need custom parsing.
         """
-        # First, try to parse using regular configparser as a fallback
-        config = configparser.ConfigParser(allow_no_value=True, interpolation=None)
-        config.optionxform = str  # Preserve case
-        
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            # Read file content unless the loader already did
+            if file_buffer is None:
+                file_buffer = FileBuffer.read(file_path)
+            buffer = file_buffer.data
             
-            # Use regex for the main parsing since Palworld has a non-standard format
-            options_match = self.options_pattern.search(content)
-            if not options_match:
-                # Try normal configparser as fallback
-                config.read(file_path)
-                
-                # Convert configparser format to our settings format
+            # Locate the OptionSettings struct; Palworld has a non-standard format
+            options_start = find_struct(buffer, 'OptionSettings')
+            self._document = None
+            if options_start == -1:
+                # Fall back to plain key=value parsing
                 settings_data = {}
-                for section in config.sections():
-                    for option in config[section]:
-                        key_name = option  # Use just the option name as the key
-                        settings_data[key_name] = config[section][option]
-                        
+                for _section, key, value, _span in iter_ini_records(buffer):
+                    settings_data[key] = value  # Use just the option name as the key
+                    
                 return settings_data
             
-            # Extract the options block using the matched pattern
-            options_block = options_match.group(1)
+            # Scan all key=value pairs of the struct in one pass
+            fields, _options_end = scan_struct(buffer, options_start)
             
-            # Create a settings dictionary
             settings_data = {}
+            document = IniDocument(buffer, file_path, signature=file_buffer.signature)
+            for key, value, span in fields:
+                settings_data[key] = unquote_value(value)
+                document.add_value(key, span)
             
-            # Use regex to find all key=value pairs in one go
-            for match in self.key_value_pattern.finditer(options_block):
-                key = match.group(1).strip()
-                value = match.group(2).strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                
-                settings_data[key] = value
-            
-            # If no settings were found, try to parse line by line
-            if not settings_data:
-                for line in options_block.split('\n'):
-                    line = line.strip()
-                    if '=' in line:
-                        parts = line.split('=', 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            
-                            # Remove trailing comma if present
-                            if value.endswith(','):
-                                value = value[:-1].strip()
-                                
-                            # Remove quotes if present
-                            if value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                                
-                            settings_data[key] = value
+            # Remember the spans so saving can patch values in place
+            self._document = document
+            self._content_hash = file_buffer.digest
+            self._options_start = options_start
+            self._last_option_key = fields[-1][0] if fields else None
             
-            # Create backup of original file
-            self._create_backup(file_path)
+            # Create backup of original file from the content already in memory
+            self._create_backup(file_path, buffer)
             
             return settings_data
             
@@ -184,52 +171,87 @@ class GameModule(BaseModule):
                 f.write(f"{datetime.now()} - Error parsing {file_path}: {str(e)}\n")
             raise ValueError(f"Failed to parse Palworld .ini file: {str(e)}")
     
+    def get_parse_state(self):
+        """Return the OptionSettings spans of the last parse for the parse cache"""
+        if self._document is None:
+            return None
+        return {
+            'spans': {key: self._document.span(key) for key in self._document.spans},
+            'options_start': self._options_start,
+            'last_option_key': self._last_option_key,
+        }
+    
+    def restore_parse_state(self, state, file_path, file_buffer):
+        """Restore a cached parse of an unchanged file without scanning it again"""
+        document = IniDocument(file_buffer.data, file_path, signature=file_buffer.signature)
+        settings_data = {}
+        for key, (start, end) in state['spans'].items():
+            document.add_value(key, (start, end))
+            settings_data[key] = unquote_value(document.get_raw(key))
+        
+        self._document = document
+        self._content_hash = file_buffer.digest
+        self._options_start = state['options_start']
+        self._last_option_key = state['last_option_key']
+        
+        # Create backup of original file, as a regular parse does
+        self._create_backup(file_path, file_buffer.data)
+        
+        return settings_data
+    
     def save_ini_file(self, file_path, settings):
         """
         Save settings to a Palworld .ini file
         
+        Only values that changed are rewritten, using the spans captured when
+        the file was parsed. Keys unknown to the schema are kept as they are.
+        If the resulting content is identical to the file, neither a backup
+        nor a write is made.
+        
         Args:
             file_path (str): Path to the .ini file
             settings (dict): Dictionary of setting names to their values
         """
         try:
-            # Create backup before saving
-            self._create_backup(file_path)
-            
-            # Read the original file
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            
-            # Find the OptionSettings block
-            options_match = self.options_pattern.search(content)
-            if not options_match:
+            # Start from the file on disk if it was never parsed or changed since
+            if self._document is None or not self._document.is_current(file_path):
+                self.parse_ini_file(file_path)
+            document = self._document
+            if document is None:
                 raise ValueError("Could not find OptionSettings in the Palworld .ini file")
             
-            # Build a new options block
-            new_options = []
+            # Settings missing from the file are added after the last field
+            if self._last_option_key is None:
+                insert_offset = self._options_start
+            else:
+                insert_offset = document.span(self._last_option_key)[1]
+            last_inserted = None
             
-            # Add each setting in a specific order
-            for setting_def in self.settings_definitions:
-                name = setting_def['name']
-                
-                if name in settings:
-                    value = settings[name]
-                    
-                    # Format based on type
-                    if setting_def['type'] == 'string' and not value.startswith('"'):
-                        value = f'"{value}"'
-                    
-                    new_options.append(f"    {name}={value}")
+            for name, value in settings.items():
+                if name in document.spans:
+                    raw = self._format_value(name, value, document.get_raw(name))
+                    document.set_raw(name, raw)
+                else:
+                    raw = self._format_value(name, value)
+                    separator = '' if self._last_option_key is None and last_inserted is None else ','
+                    document.insert_value(name, insert_offset, f"{separator}{name}=", raw)
+                    last_inserted = name
             
-            # Join with commas and newlines
-            new_options_block = ",\n".join(new_options)
+            # Skip the backup and the write when nothing changed
+            if not document.is_modified():
+                return
+            if hashlib.sha1(document.render()).hexdigest() == self._content_hash:
+                document.discard_changes()
+                return
             
-            # Replace the old options block
-            new_content = content[:options_match.start(1)] + "\n" + new_options_block + "\n" + content[options_match.end(1):]
+            # Create backup of the current content before saving
+            self._create_backup(file_path, document.buffer)
             
-            # Write the updated content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # Patch the changed values
+            document.save(file_path)
+            if last_inserted is not None:
+                self._last_option_key = last_inserted
+            self._content_hash = hashlib.sha1(document.buffer).hexdigest()
                 
         except Exception as e:
             # Log the error
@@ -238,8 +260,26 @@ class GameModule(BaseModule):
                 f.write(f"{datetime.now()} - Error saving {file_path}: {str(e)}\n")
             raise ValueError(f"Failed to save Palworld .ini file: {str(e)}")
     
-    def _create_backup(self, file_path):
-        """Create a backup of the ini file before modifying it"""
+    def _format_value(self, name, value, original_raw=None):
+        """Format a value the way Palworld writes it in OptionSettings"""
+        setting = self.settings_definitions.get(name)
+        original = None if original_raw is None else unquote_value(original_raw)
+        text = PALWORLD_CODECS.for_setting(setting).encode(value, original)
+        
+        # Strings are quoted, as are values that were quoted in the file
+        quoted = (setting is not None and setting.type == 'string') or (original_raw or '').startswith('"')
+        if quoted and not text.startswith('"'):
+            text = f'"{text}"'
+        return text
+    
+    def _create_backup(self, file_path, data=None):
+        """
+        Create a backup of the ini file before modifying it
+        
+        Args:
+            file_path (str): Path to the .ini file
+            data (bytes, optional): File content already in memory; read from disk if omitted
+        """
         try:
             # Create backups directory if it doesn't exist
             backup_dir = os.path.join(self.module_dir, 'backups')
@@ -251,10 +291,11 @@ class GameModule(BaseModule):
             backup_name = f"{os.path.splitext(file_name)[0]}_{timestamp}.ini"
             backup_path = os.path.join(backup_dir, backup_name)
             
-            # Copy the file
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as src:
-                with open(backup_path, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
+            # Copy the file byte for byte
+            if data is None:
+                data = FileBuffer.read(file_path).data
+            with open(backup_path, 'wb') as dst:
+                dst.write(data)
                     
             return True
         except Exception as e:
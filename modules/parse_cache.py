@@ -0,0 +1,153 @@
+"""
+Persistent cache of parse results.
+
+Parsing a large configuration file and inferring its setting definitions is
+the most expensive part of opening it. The ParseCache stores the result of a
+module's parse on disk, keyed by the file's path and validated by its size,
+modification time and content hash, so reopening an unchanged file skips
+parsing entirely. Entries are evicted least-recently-used first once the cache
+exceeds its entry or size limit.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+INDEX_FILE = 'index.json'
+
+# Bumped whenever the layout of cached entries changes
+CACHE_VERSION = 2
+
+
+class ParseCache:
+    """
+    On-disk LRU cache of module parse states
+    """
+
+    def __init__(self, cache_dir, max_entries=32, max_bytes=64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, INDEX_FILE)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """Load the cache index, starting empty if it is missing or unreadable"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get('version') != CACHE_VERSION:
+            return {}
+        return index.get('entries', {})
+
+    def _save_index(self):
+        """Write the index atomically so a crash never leaves it half written"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': self.index}, f)
+        os.replace(temp_path, self.index_path)
+
+    @staticmethod
+    def _entry_key(file_path):
+        """Return the cache key for a file path"""
+        return hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+
+    def get(self, file_path, file_buffer, module_name):
+        """
+        Return the cached parse state for a file, or None on a miss
+
+        Args:
+            file_path (str): Path to the .ini file
+            file_buffer (FileBuffer): The file's current content
+            module_name (str): Name of the module the state must belong to
+
+        Returns:
+            dict: The state stored by put(), or None if missing or stale
+        """
+        key = self._entry_key(file_path)
+        entry = self.index.get(key)
+        if entry is None or file_buffer.signature is None:
+            return None
+
+        size, mtime_ns = file_buffer.signature
+        if (entry['path'] != os.path.abspath(file_path) or entry['size'] != size
+                or entry['mtime_ns'] != mtime_ns or entry['module'] != module_name
+                or entry['digest'] != file_buffer.digest):
+            return None
+
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            self._remove(key)
+            return None
+
+        entry['last_used'] = time.time()
+        try:
+            self._save_index()
+        except OSError:
+            pass
+        return state
+
+    def put(self, file_path, file_buffer, module_name, state):
+        """
+        Store the parse state for a file and evict old entries if needed
+
+        Args:
+            file_path (str): Path to the .ini file
+            file_buffer (FileBuffer): The content the state was parsed from
+            module_name (str): Name of the module that produced the state
+            state (dict): JSON-serializable parse state
+        """
+        if file_buffer.signature is None:
+            return
+
+        key = self._entry_key(file_path)
+        data = json.dumps(state, separators=(',', ':')).encode('utf-8')
+        if len(data) > self.max_bytes:
+            self._remove(key)
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, f"{key}.json"), 'wb') as f:
+            f.write(data)
+
+        size, mtime_ns = file_buffer.signature
+        self.index[key] = {
+            'path': os.path.abspath(file_path),
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'digest': file_buffer.digest,
+            'module': module_name,
+            'bytes': len(data),
+            'last_used': time.time(),
+        }
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is within its limits"""
+        total = sum(entry['bytes'] for entry in self.index.values())
+        by_age = sorted(self.index, key=lambda key: self.index[key]['last_used'])
+        for key in by_age:
+            if len(self.index) <= self.max_entries and total <= self.max_bytes:
+                break
+            total -= self.index[key]['bytes']
+            self._remove(key, save=False)
+
+    def _remove(self, key, save=True):
+        """Remove an entry and its data file"""
+        self.index.pop(key, None)
+        try:
+            os.remove(os.path.join(self.cache_dir, f"{key}.json"))
+        except OSError:
+            pass
+        if save:
+            try:
+                self._save_index()
+            except OSError:
+                pass
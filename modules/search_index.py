@@ -0,0 +1,250 @@
+"""
+Inverted index for searching setting definitions.
+
+The index is built once when a module is loaded. Names, categories and
+descriptions are split into terms (whole words and their camelCase parts),
+and every term keeps a posting list of the settings it occurs in. Because
+many settings share the same words (section names, key names), the set of
+distinct terms is small; a trigram index over the terms finds the terms
+containing a query word without scanning every setting.
+
+Results are ranked by how well a term matches (exact, prefix, substring) and
+by the field it comes from (name, category, description). The terms of each
+field are kept sorted by length, so the matching terms are found tier by tier,
+shortest first, and a search stops as soon as it has ``limit`` results; files
+whose keys are all distinct (and so have as many terms as keys) don't make a
+query look at every matching term.
+"""
+
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+# Words are runs of letters and digits; camelCase words are also split into parts
+WORD_PATTERN = re.compile(r'[A-Za-z0-9]+')
+CAMEL_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+# Field weights, higher ranks first
+NAME_WEIGHT = 3
+CATEGORY_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+# Match quality of a term against a query word
+EXACT_MATCH = 3
+PREFIX_MATCH = 2
+SUBSTRING_MATCH = 1
+
+# (match quality, field weight) tiers, best first: by score (quality * weight),
+# then name over other fields
+RANK_TIERS = sorted(((quality, weight)
+                     for quality in (EXACT_MATCH, PREFIX_MATCH, SUBSTRING_MATCH)
+                     for weight in (NAME_WEIGHT, CATEGORY_WEIGHT, DESCRIPTION_WEIGHT)),
+                    key=lambda tier: (-tier[0] * tier[1], -tier[1]))
+
+# Sorts after every term starting with a given prefix
+PREFIX_END = '\uffff'
+
+# Substring matches are looked up in the trigram index if one of the query's
+# trigrams occurs in at most this many terms; more common ones are found by
+# walking the terms in order of length, which stops at the first results
+TRIGRAM_LOOKUP_TERMS = 1000
+
+DEFAULT_LIMIT = 200
+
+
+def split_terms(text):
+    """Return the lowercase terms of a text: each word and, for camelCase words, its parts"""
+    terms = []
+    for word in WORD_PATTERN.findall(text):
+        terms.append(word.lower())
+        parts = CAMEL_PATTERN.findall(word)
+        if len(parts) > 1:
+            terms.extend(part.lower() for part in parts)
+    return terms
+
+
+def trigrams(term):
+    """Return the set of trigrams of a term"""
+    return {term[i:i + 3] for i in range(len(term) - 2)}
+
+
+class SearchIndex:
+    """
+    Ranked search over a set of setting definitions
+    """
+
+    def __init__(self, definitions):
+        self.settings = list(definitions)
+
+        # (term, weight) -> posting list of setting positions, in definition order
+        self._postings = {}
+        self._field_cache = {}
+        for position, setting in enumerate(self.settings):
+            name = setting.name
+            category = setting.category
+            if category and name.startswith(category) and name[len(category):len(category) + 1] == '.':
+                # Keys named "Section.option" (generic files): both parts repeat
+                # across many settings, so their postings are looked up once
+                postings_lists = (self._field_postings(category, NAME_WEIGHT)
+                                  + self._field_postings(name[len(category) + 1:], NAME_WEIGHT))
+            else:
+                postings_lists = self._field_postings(name, NAME_WEIGHT)
+                if category:
+                    postings_lists += self._field_postings(category, CATEGORY_WEIGHT)
+            if setting.has_description:
+                postings_lists += self._field_postings(setting.description, DESCRIPTION_WEIGHT)
+            for postings in postings_lists:
+                postings.append(position)
+        self._field_cache = None
+
+        # Weight -> [(length, sorted terms)], in order of length
+        lengths = {}
+        for term, weight in self._postings:
+            lengths.setdefault(weight, {}).setdefault(len(term), []).append(term)
+        self._terms_by_length = {
+            weight: [(length, sorted(terms)) for length, terms in sorted(field_lengths.items())]
+            for weight, field_lengths in lengths.items()
+        }
+
+        # Trigram -> terms, over the distinct terms only
+        self._trigrams = {}
+        for term in {term for term, _weight in self._postings}:
+            for trigram in trigrams(term):
+                self._trigrams.setdefault(trigram, set()).add(term)
+
+    def _field_postings(self, text, weight):
+        """Return the posting lists of the distinct terms of a field's text"""
+        key = (text, weight)
+        postings_lists = self._field_cache.get(key)
+        if postings_lists is None:
+            postings_lists = []
+            for term in dict.fromkeys(split_terms(text)):
+                postings = self._postings.get((term, weight))
+                if postings is None:
+                    postings = self._postings[(term, weight)] = array('I')
+                postings_lists.append(postings)
+            postings_lists = self._field_cache[key] = tuple(postings_lists)
+        return postings_lists
+
+    def _prefix_terms(self, word, weight):
+        """Yield the terms of a field that start with a query word and are longer, shortest first"""
+        end = word + PREFIX_END
+        for length, terms in self._terms_by_length.get(weight, ()):
+            if length > len(word):
+                for i in range(bisect_left(terms, word), bisect_left(terms, end)):
+                    yield terms[i]
+
+    def _substring_terms(self, word, weight):
+        """Yield the terms of a field containing a query word after their start, shortest first"""
+        candidates = None
+        if len(word) >= 3:
+            candidate_sets = [self._trigrams.get(trigram) for trigram in trigrams(word)]
+            if not all(candidate_sets):
+                return
+            rarest = min(candidate_sets, key=len)
+            if len(rarest) <= TRIGRAM_LOOKUP_TERMS:
+                candidates = rarest.intersection(*candidate_sets)
+
+        if candidates is None:
+            for length, terms in self._terms_by_length.get(weight, ()):
+                if length > len(word):
+                    for term in terms:
+                        if word in term and not term.startswith(word):
+                            yield term
+            return
+
+        heap = [(len(term), term) for term in candidates
+                if (term, weight) in self._postings and word in term and not term.startswith(word)]
+        # Only the terms a search gets to are taken off the heap
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[1]
+
+    def _ranked_postings(self, word):
+        """
+        Yield the posting lists matching a query word, best match first
+
+        Within a tier shorter (closer) terms come first. The terms are found
+        lazily, so a search that stops early doesn't look at the other ones.
+        """
+        for quality, weight in RANK_TIERS:
+            if quality == EXACT_MATCH:
+                terms = (word,)
+            elif quality == PREFIX_MATCH:
+                terms = self._prefix_terms(word, weight)
+            else:
+                terms = self._substring_terms(word, weight)
+            for term in terms:
+                postings = self._postings.get((term, weight))
+                if postings is not None:
+                    yield postings
+
+    def _counted_postings(self, word, limit):
+        """
+        Return the number of positions matching a query word, counted up to limit,
+        and an iterator over its ranked posting lists
+        """
+        ranked = self._ranked_postings(word)
+        head = []
+        count = 0
+        for postings in ranked:
+            head.append(postings)
+            count += len(postings)
+            if count >= limit:
+                break
+        return count, chain(head, ranked)
+
+    def _search_text(self, setting):
+        """Return the lowercase text of the searchable fields of a setting"""
+        text = f"{setting.name}\n{setting.category or ''}"
+        if setting.has_description:
+            text = f"{text}\n{setting.description}"
+        return text.lower()
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """
+        Find the settings matching every word of a query
+
+        Args:
+            text (str): Search text; each word must occur in the name, category
+                or description of a setting
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Matching SettingDef objects, best match first
+        """
+        words = [word.lower() for word in WORD_PATTERN.findall(text)]
+        if not words:
+            return []
+
+        # Rank by the most selective word and walk its postings best first;
+        # the other words are checked on the candidates' text. Every word is a
+        # run of letters and digits, so a substring match equals a term match.
+        # Matches are only counted up to limit to pick the most selective word
+        counts = {}
+        rankings = {}
+        for word in dict.fromkeys(words):
+            counts[word], rankings[word] = self._counted_postings(word, limit)
+            if not counts[word]:
+                return []
+        primary = min(counts, key=counts.get)
+        others = [word for word in rankings if word != primary]
+
+        results = []
+        seen = set()
+        for postings in rankings[primary]:
+            for position in postings:
+                if position in seen:
+                    continue
+                seen.add(position)
+                setting = self.settings[position]
+                if others:
+                    text = self._search_text(setting)
+                    if not all(word in text for word in others):
+                        continue
+                results.append(setting)
+                if len(results) >= limit:
+                    return results
+        return results
@@ -0,0 +1,102 @@
+"""
+Hierarchy of the sections of an .ini file.
+
+Engine configs name their sections like ``/Script/Engine.GameSession`` and can
+have thousands of them, too many for one flat row of tabs. SectionIndex splits
+the section names on dots into a tree once, when a file is opened, so a
+navigator only has to create the nodes of the levels that are expanded.
+Filtering returns a new index over the matching sections.
+"""
+
+# Separator of the levels of a section name
+SEPARATOR = '.'
+
+
+class SectionNode:
+    """
+    Node of a SectionIndex: one level of a section name
+    """
+
+    __slots__ = ('label', 'section', 'children', 'count')
+
+    def __init__(self, label):
+        self.label = label
+        # Full section name if the node is a section itself, None for a group
+        self.section = None
+        self.children = {}
+        # Number of sections in this subtree
+        self.count = 0
+
+    def __repr__(self):
+        return f"SectionNode({self.label!r}, section={self.section!r})"
+
+
+class SectionIndex:
+    """
+    Tree of section names split into levels
+
+    Args:
+        sections (iterable): Section names
+    """
+
+    def __init__(self, sections):
+        self.sections = list(sections)
+        self.root = SectionNode('')
+        for section in self.sections:
+            node = self.root
+            node.count += 1
+            for part in section.split(SEPARATOR):
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = SectionNode(part)
+                child.count += 1
+                node = child
+            node.section = section
+
+    def children(self, node=None):
+        """Return the child nodes of a node (the top level if None), sorted by label"""
+        node = self.root if node is None else node
+        return sorted(node.children.values(), key=lambda child: child.label.lower())
+
+    def path(self, section):
+        """Return the nodes from the top level down to a section, or [] if it isn't indexed"""
+        nodes = []
+        node = self.root
+        for part in section.split(SEPARATOR):
+            node = node.children.get(part)
+            if node is None:
+                return []
+            nodes.append(node)
+        return nodes if node.section == section else []
+
+    def first_section(self):
+        """Return the first section in tree order, or None if the index is empty"""
+        node = self.root
+        while True:
+            children = self.children(node)
+            if not children:
+                return node.section
+            node = children[0]
+            if node.section is not None:
+                return node.section
+
+    def filtered(self, text='', sections=None):
+        """
+        Return an index of the sections matching a filter
+
+        Args:
+            text (str): Text the section names must contain, ignoring case
+            sections (set, optional): Sections to keep, e.g. those with search matches
+
+        Returns:
+            SectionIndex: A new index
+        """
+        text = text.lower()
+        return SectionIndex(section for section in self.sections
+                            if (sections is None or section in sections) and text in section.lower())
+
+    def __contains__(self, section):
+        return bool(self.path(section))
+
+    def __len__(self):
+        return len(self.sections)
@@ -0,0 +1,163 @@
+"""
+Setting definition types.
+
+A SettingDef describes one setting (name, type, default, constraints, ...)
+using __slots__ instead of a dict, which keeps memory low for files with
+hundreds of thousands of keys. SettingDefinitions holds the definitions of a
+module in order and keeps name and category indexes, so lookups don't have to
+scan the whole list.
+"""
+
+
+# (min, max) used for numeric settings that don't define their own range
+DEFAULT_RANGES = {
+    'integer': (-2147483647, 2147483647),
+    'float': (-1000000.0, 1000000.0),
+}
+
+
+class SettingDef:
+    """
+    Definition of a single setting
+    """
+
+    __slots__ = ('name', 'type', 'default', 'category', 'section', '_description',
+                 'min', 'max', 'options', 'pattern')
+
+    # Keys accepted by from_dict / produced by to_dict, in settings.json order
+    FIELDS = ('name', 'category', 'section', 'type', 'options', 'min', 'max',
+              'pattern', 'default', 'description')
+
+    def __init__(self, name, type='string', default='', category=None, section=None,
+                 description=None, min=None, max=None, options=None, pattern=None):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.category = category
+        self.section = section
+        self._description = description
+        self.min = min
+        self.max = max
+        self.options = options
+        self.pattern = pattern
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a definition from a settings.json style dictionary"""
+        return cls(**{key: data[key] for key in cls.FIELDS if key in data})
+
+    def to_dict(self):
+        """Return the definition as a settings.json style dictionary"""
+        result = {}
+        for key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    @property
+    def description(self):
+        """Description of the setting, falling back to a generated one"""
+        if self._description is None:
+            return self._default_description()
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+
+    @property
+    def has_description(self):
+        """True if the description was given rather than generated"""
+        return self._description is not None
+
+    def _default_description(self):
+        """Description used when none was given; subclasses may generate one"""
+        return ''
+
+    def value_range(self):
+        """Return the (min, max) range, using the type's default bounds where unset"""
+        default_min, default_max = DEFAULT_RANGES.get(self.type, (None, None))
+        return (default_min if self.min is None else self.min,
+                default_max if self.max is None else self.max)
+
+    def get(self, key, default=None):
+        """Dictionary-style access for code written against dict definitions"""
+        value = getattr(self, key, None) if key in self.FIELDS else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.FIELDS and getattr(self, key) is not None
+
+    def __repr__(self):
+        return f"SettingDef({self.name!r}, type={self.type!r})"
+
+
+class SettingDefinitions:
+    """
+    Ordered collection of SettingDef objects with name and category indexes
+    """
+
+    def __init__(self, settings=()):
+        self._settings = []
+        self._by_name = {}
+        self._by_category = {}
+        self._categories = None
+        for setting in settings:
+            self.add(setting)
+
+    @classmethod
+    def from_dicts(cls, settings):
+        """Create a collection from a list of settings.json style dictionaries"""
+        return cls(SettingDef.from_dict(setting) for setting in settings)
+
+    def add(self, setting):
+        """Append a definition and index it; a later definition with the same name replaces the lookup"""
+        self._settings.append(setting)
+        self._by_name[setting.name] = setting
+        category = setting.category
+        if category is not None:
+            if category not in self._by_category:
+                self._by_category[category] = []
+                self._categories = None
+            self._by_category[category].append(setting)
+        return setting
+
+    def get(self, name, default=None):
+        """Return the definition for a setting name"""
+        return self._by_name.get(name, default)
+
+    def categories(self):
+        """Return the sorted list of categories"""
+        if self._categories is None:
+            self._categories = sorted(self._by_category)
+        return self._categories
+
+    def by_category(self, category):
+        """Return the definitions of a category, in file/definition order"""
+        return self._by_category.get(category, [])
+
+    def defaults(self):
+        """Return a dictionary of setting names to default values"""
+        return {setting.name: setting.default for setting in self._settings}
+
+    def to_dicts(self):
+        """Return the definitions as a list of settings.json style dictionaries"""
+        return [setting.to_dict() for setting in self._settings]
+
+    def __iter__(self):
+        return iter(self._settings)
+
+    def __len__(self):
+        return len(self._settings)
+
+    def __getitem__(self, index):
+        return self._settings[index]
+
+    def __contains__(self, name):
+        return name in self._by_name
@@ -0,0 +1,230 @@
+"""
+Validation of setting values against their definitions.
+
+A Validator compiles the constraints of every definition once, when a file is
+opened: patterns are compiled with re, ranges are resolved, and definitions
+with the same constraints share a single check. Afterwards only the keys that
+change are validated again, and the current errors are kept in a live set so
+the UI can report them without a full pass.
+
+Modules can also declare rules spanning several settings in their
+settings.json, e.g. ``{"left": "CoopPlayerMaxNum", "op": "<=", "right":
+"ServerPlayerMaxNum"}``. Rules are indexed by the settings they read, so a
+change only re-evaluates the rules that depend on the changed key.
+"""
+
+import operator
+import re
+
+# Operators allowed in rules
+RULE_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+    'implies': lambda left, right: not left or bool(right),
+}
+
+
+class Rule:
+    """
+    Constraint between two settings, e.g. CoopPlayerMaxNum <= ServerPlayerMaxNum
+    """
+
+    __slots__ = ('left', 'op', 'right', 'message', '_compare')
+
+    def __init__(self, left, op, right, message=None):
+        if op not in RULE_OPERATORS:
+            raise ValueError(f"Unknown rule operator: {op!r}")
+        self.left = left
+        self.op = op
+        self.right = right
+        self._compare = RULE_OPERATORS[op]
+        if message is None:
+            if op == 'implies':
+                message = f"'{right}' must be enabled when '{left}' is enabled"
+            else:
+                message = f"'{left}' must be {op} '{right}'"
+        self.message = message
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a rule from a settings.json style dictionary"""
+        return cls(data['left'], data['op'], data['right'], data.get('message'))
+
+    @property
+    def names(self):
+        """The settings this rule depends on"""
+        return (self.left, self.right)
+
+    def check(self, values):
+        """
+        Evaluate the rule
+
+        A setting missing from the file has its default value, as in the game,
+        if values is a ValueStore.
+
+        Returns:
+            str: The error message, or None if the rule holds or can't be evaluated
+                (a setting has neither a value nor a default, or its value has the wrong type)
+        """
+        left = self._value(values, self.left)
+        right = self._value(values, self.right)
+        if left is None or right is None:
+            return None
+        try:
+            holds = self._compare(left, right)
+        except TypeError:
+            return None
+        return None if holds else self.message
+
+    @staticmethod
+    def _value(values, name):
+        """Return the value of a setting, its decoded default if it is missing, or None"""
+        if name in values:
+            return values[name]
+        if hasattr(values, 'default'):
+            return values.default(name)
+        return None
+
+    def __repr__(self):
+        return f"Rule({self.left!r} {self.op} {self.right!r})"
+
+
+class Validator:
+    """
+    Compiled validation rules with a live set of errors
+    """
+
+    def __init__(self, definitions, rules=()):
+        self.definitions = definitions
+        self.errors = {}
+        self._checks = {}
+        self._compiled = {}
+        for setting in definitions:
+            self._checks[setting.name] = self._compile(setting)
+
+        # Dependency graph: setting name -> rules that read it
+        self.rules = [rule if isinstance(rule, Rule) else Rule.from_dict(rule) for rule in rules]
+        self._dependents = {}
+        for rule in self.rules:
+            for name in set(rule.names):
+                self._dependents.setdefault(name, []).append(rule)
+
+    def _compile(self, setting):
+        """Return the check function of a definition, or None if it has no constraints"""
+        if setting.type == 'integer':
+            key = ('integer',) + setting.value_range()
+        elif setting.type == 'float':
+            key = ('float',) + setting.value_range()
+        elif setting.type == 'string' and setting.pattern:
+            key = ('pattern', setting.pattern)
+        else:
+            return None
+
+        # Definitions with identical constraints share one check
+        check = self._compiled.get(key)
+        if check is None:
+            check = self._compiled[key] = self._build_check(key)
+        return check
+
+    @staticmethod
+    def _build_check(key):
+        """Build a check returning an error message (with a {name} field) or None"""
+        kind = key[0]
+        if kind == 'pattern':
+            match = re.compile(key[1]).match
+            message = "'{name}' does not match the required pattern"
+            return lambda value: None if match(str(value)) else message
+
+        _kind, min_val, max_val = key
+        range_message = f"'{{name}}' must be between {min_val} and {max_val}"
+        if kind == 'integer':
+            type_message = "'{name}' must be an integer"
+            value_types = int
+        else:
+            type_message = "'{name}' must be a number"
+            value_types = (int, float)
+
+        # Values are decoded when the file is opened; one still held as text
+        # could not be converted to the setting's type
+        def check(value):
+            if not isinstance(value, value_types):
+                return type_message
+            if value < min_val or value > max_val:
+                return range_message
+            return None
+        return check
+
+    def _check_for(self, name):
+        """Return the check of a setting, compiling it if the setting was defined after loading"""
+        try:
+            return self._checks[name]
+        except KeyError:
+            setting = self.definitions.get(name)
+            check = self._checks[name] = None if setting is None else self._compile(setting)
+            return check
+
+    def validate(self, name, values):
+        """
+        Validate one setting and the rules depending on it, and update the error set
+
+        Args:
+            name (str): Setting name
+            values (dict): Setting names to their current (decoded) values
+
+        Returns:
+            str: The first error involving the setting, or None if there is none
+        """
+        check = self._check_for(name)
+        message = None if check is None or name not in values else check(values[name])
+        if message is None:
+            self.errors.pop(name, None)
+        else:
+            message = self.errors[name] = message.format(name=name)
+
+        # Only the rules reading this setting can change their outcome
+        for rule in self._dependents.get(name, ()):
+            rule_message = rule.check(values)
+            if rule_message is None:
+                self.errors.pop(rule, None)
+            else:
+                self.errors[rule] = rule_message
+                if message is None:
+                    message = rule_message
+        return message
+
+    def validate_keys(self, names, values):
+        """Validate the given settings of a value mapping"""
+        for name in names:
+            self.validate(name, values)
+
+    def validate_all(self, values):
+        """
+        Validate every constrained setting and rule, and rebuild the error set
+
+        Args:
+            values (dict): Setting names to their current (decoded) values
+
+        Returns:
+            dict: Setting names (or Rule objects) to error messages
+        """
+        errors = {}
+        for name, check in self._checks.items():
+            if check is None or name not in values:
+                continue
+            message = check(values[name])
+            if message is not None:
+                errors[name] = message.format(name=name)
+        for rule in self.rules:
+            message = rule.check(values)
+            if message is not None:
+                errors[rule] = message
+        self.errors = errors
+        return errors
+
+    def messages(self):
+        """Return the current error messages"""
+        return list(self.errors.values())
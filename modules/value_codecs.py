@@ -0,0 +1,196 @@
+"""
+Codecs between the text stored in .ini files and typed Python values.
+
+Each setting type (integer, float, boolean, enum, string) has a codec that
+decodes the text once when a file is opened and encodes the value again when
+it is saved. The UI, validation and the module serializers all go through the
+same CodecRegistry, so a value is never converted with ad-hoc int()/float()
+calls in several places.
+
+Encoding takes the original text of the value when there is one: if the value
+didn't change, the original spelling is returned untouched (e.g. ``1.50`` is
+not rewritten as ``1.5``), and booleans keep the style of the file (1/0,
+yes/no, True/False).
+"""
+
+
+class ValueCodec:
+    """
+    Codec for plain text values; base class of the typed codecs
+    """
+
+    def decode(self, text):
+        """
+        Decode the text of a value
+
+        Raises:
+            ValueError: If the text is not a valid value of this type
+        """
+        return text
+
+    def format(self, value):
+        """Format a typed value as text"""
+        return str(value)
+
+    def to_value(self, value):
+        """
+        Convert text or an already typed value (e.g. from a widget or JSON) to this type
+
+        Raises:
+            ValueError: If the value can't be converted
+        """
+        if isinstance(value, str):
+            return self.decode(value)
+        return value
+
+    def encode(self, value, original=None):
+        """
+        Encode a value as text, keeping the original spelling if the value is unchanged
+
+        Args:
+            value: Typed value, or text that could not be decoded
+            original (str, optional): Text the value had in the file
+
+        Returns:
+            str: Text to write to the file
+        """
+        if value is None:
+            return ''
+        if isinstance(value, str):
+            return value
+        if original is not None:
+            try:
+                if self.decode(original) == value:
+                    return original
+            except ValueError:
+                pass
+        return self.format(value)
+
+
+class IntegerCodec(ValueCodec):
+    """Codec for integer values"""
+
+    def decode(self, text):
+        return int(text.strip())
+
+    def to_value(self, value):
+        if isinstance(value, str):
+            return self.decode(value)
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        raise ValueError(f"Not an integer: {value!r}")
+
+
+class FloatCodec(ValueCodec):
+    """
+    Codec for float values
+
+    Args:
+        precision (int, optional): Number of decimals written; the shortest
+            representation is used if omitted
+    """
+
+    def __init__(self, precision=None):
+        self.precision = precision
+
+    def decode(self, text):
+        return float(text.strip())
+
+    def format(self, value):
+        if self.precision is None:
+            return repr(float(value))
+        return f"{value:.{self.precision}f}"
+
+    def to_value(self, value):
+        if isinstance(value, str):
+            return self.decode(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        raise ValueError(f"Not a number: {value!r}")
+
+
+class BooleanCodec(ValueCodec):
+    """Codec for boolean values written as true/false, yes/no, on/off or 1/0"""
+
+    # (true spelling, false spelling) pairs, in lower case
+    SPELLINGS = (('true', 'false'), ('yes', 'no'), ('on', 'off'), ('1', '0'))
+
+    TRUE_WORDS = frozenset(true for true, _false in SPELLINGS)
+    FALSE_WORDS = frozenset(false for _true, false in SPELLINGS)
+
+    def decode(self, text):
+        word = text.strip().lower()
+        if word in self.TRUE_WORDS:
+            return True
+        if word in self.FALSE_WORDS:
+            return False
+        raise ValueError(f"Not a boolean: {text!r}")
+
+    def format(self, value):
+        return "True" if value else "False"
+
+    def to_value(self, value):
+        if isinstance(value, str):
+            return self.decode(value)
+        return bool(value)
+
+    def encode(self, value, original=None):
+        if value is None or isinstance(value, str) or original is None:
+            return super().encode(value, original)
+
+        # Use the same pair of words and the same capitalization as the file
+        stripped = original.strip()
+        word = stripped.lower()
+        for true_word, false_word in self.SPELLINGS:
+            if word in (true_word, false_word):
+                text = true_word if value else false_word
+                break
+        else:
+            return self.format(value)
+
+        if stripped.isupper():
+            return text.upper()
+        if stripped[:1].isupper():
+            return text.capitalize()
+        return text
+
+
+class CodecRegistry:
+    """
+    Mapping of setting types to codecs; unknown types use the text codec
+    """
+
+    def __init__(self, codecs=None, fallback=None):
+        self._codecs = dict(codecs or {})
+        self.fallback = fallback or ValueCodec()
+
+    def get(self, setting_type):
+        """Return the codec for a setting type"""
+        return self._codecs.get(setting_type, self.fallback)
+
+    def for_setting(self, setting):
+        """Return the codec for a setting definition, or the text codec if there is none"""
+        if setting is None:
+            return self.fallback
+        return self.get(setting.type)
+
+    def register(self, setting_type, codec):
+        """Register or replace the codec of a setting type"""
+        self._codecs[setting_type] = codec
+
+    def copy(self, **overrides):
+        """Return a new registry with some codecs replaced, e.g. copy(float=FloatCodec(6))"""
+        codecs = dict(self._codecs)
+        codecs.update(overrides)
+        return CodecRegistry(codecs, self.fallback)
+
+
+DEFAULT_CODECS = CodecRegistry({
+    'integer': IntegerCodec(),
+    'float': FloatCodec(),
+    'boolean': BooleanCodec(),
+    'enum': ValueCodec(),
+    'string': ValueCodec(),
+})
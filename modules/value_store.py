@@ -0,0 +1,152 @@
+"""
+Typed store of the values of an open file.
+
+A ValueStore is a dictionary of setting names to Python values (int, float,
+bool, str) decoded once from the file's text with the module's codecs.
+Values assigned later, from widgets or an imported JSON file, are converted
+to the setting's type on assignment. A value that can't be decoded is kept as
+its original text, so nothing is lost and validation can report it.
+
+The store also keeps a read-only snapshot of the values as they are on disk,
+so a single setting can be compared with its original and default values
+without a pass over the file. Settings assigned or deleted since the snapshot
+are tracked, so finding the modified ones only looks at those.
+"""
+
+from types import MappingProxyType
+
+from modules.value_codecs import DEFAULT_CODECS
+
+
+def same_value(a, b):
+    """Return True if two decoded values are equal and of the same type (1 differs from True and 1.0)"""
+    return type(a) is type(b) and a == b
+
+
+class ValueStore(dict):
+    """
+    Setting values decoded to their types
+    """
+
+    def __init__(self, definitions=None, codecs=None):
+        super().__init__()
+        self.definitions = definitions
+        self.codecs = codecs or DEFAULT_CODECS
+        self._defaults = {}
+        self._original = {}
+        self.original = MappingProxyType(self._original)
+        # Names assigned or deleted since the last snapshot, in order
+        self._assigned = {}
+        # Text of the original values, if kept (see from_raw)
+        self._texts = None
+
+    @classmethod
+    def from_raw(cls, raw_values, definitions=None, codecs=None, keep_text=False, decoded=None):
+        """
+        Decode the raw text values of a parsed file
+
+        Args:
+            raw_values (dict): Setting names to the text found in the file
+            definitions (SettingDefinitions, optional): Definitions giving each setting's type
+            codecs (CodecRegistry, optional): Codecs to decode with
+            keep_text (bool): Keep the text of the values, so encode() spells
+                unchanged values as they are in the file
+            decoded (list, optional): The values already decoded, in the order of
+                raw_values (e.g. from the parse cache); they are not decoded again
+
+        Returns:
+            ValueStore: The decoded values
+        """
+        store = cls(definitions, codecs)
+        if decoded is not None:
+            dict.update(store, zip(raw_values, decoded))
+        else:
+            for name, value in raw_values.items():
+                dict.__setitem__(store, name, store._to_value(name, value))
+        store._original.update(store)
+        if keep_text:
+            store._texts = dict(raw_values)
+        return store
+
+    def snapshot(self):
+        """
+        Record the current values as the original ones, e.g. after they were saved
+
+        Only the settings assigned or deleted since the last snapshot are
+        copied. Modules may update their definitions when saving, so defaults
+        are decoded again afterwards.
+        """
+        for name in self._assigned:
+            if name in self:
+                self._original[name] = dict.__getitem__(self, name)
+                if self._texts is not None:
+                    self._texts[name] = self.encode(name)
+            else:
+                self._original.pop(name, None)
+                if self._texts is not None:
+                    self._texts.pop(name, None)
+        self._assigned = {}
+        self._defaults = {}
+
+    def codec(self, name):
+        """Return the codec used for a setting"""
+        setting = self.definitions.get(name) if self.definitions is not None else None
+        return self.codecs.for_setting(setting)
+
+    def _to_value(self, name, value):
+        """Convert a value to the setting's type, keeping it unchanged if that isn't possible"""
+        try:
+            return self.codec(name).to_value(value)
+        except (ValueError, TypeError):
+            return value
+
+    def __setitem__(self, name, value):
+        super().__setitem__(name, self._to_value(name, value))
+        self._assigned[name] = None
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._assigned[name] = None
+
+    def update(self, *args, **kwargs):
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def default(self, name):
+        """Return the decoded default value of a setting, or None if it has no definition"""
+        if name not in self._defaults:
+            setting = self.definitions.get(name) if self.definitions is not None else None
+            self._defaults[name] = None if setting is None else self._to_value(name, setting.default)
+        return self._defaults[name]
+
+    def is_modified(self, name):
+        """Return True if a setting's value differs from the original one (or was added)"""
+        if name not in self:
+            return name in self.original
+        return name not in self.original or not same_value(self[name], self.original[name])
+
+    def is_default(self, name):
+        """Return True if a setting has its default value (settings without a value have it)"""
+        return name not in self or same_value(self[name], self.default(name))
+
+    def modified_keys(self):
+        """Return the names of the settings that differ from the original values, in the order they were assigned"""
+        return [name for name in self._assigned if self.is_modified(name)]
+
+    def non_default_keys(self):
+        """Return the names of the settings whose value differs from their default"""
+        return {name for name in self if not self.is_default(name)}
+
+    def encode(self, name, original=None):
+        """
+        Return the text of a value as it should be written, see ValueCodec.encode
+
+        The original text defaults to the one kept by from_raw, if any.
+        """
+        if original is None and self._texts is not None:
+            original = self._texts.get(name)
+        return self.codec(name).encode(self[name], original)
+
+    def to_text(self):
+        """Return a dictionary of setting names to the text of their values"""
+        return {name: self.encode(name) for name in self}
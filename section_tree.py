@@ -0,0 +1,147 @@
+"""
+Lazily populated section navigator for files with many sections.
+
+A tab per section becomes slow and unusable once a file has hundreds or
+thousands of sections. SectionTree shows the sections of a SectionIndex as a
+tree instead: only the top level is created up front, the children of a node
+are created the first time it is expanded, and the settings page of a section
+is only built when it is selected. A filter box above the tree narrows the
+sections by name.
+"""
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QLineEdit, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+
+# Filtered trees with at most this many sections are shown fully expanded
+AUTO_EXPAND_SECTIONS = 50
+
+NODE_ROLE = Qt.ItemDataRole.UserRole
+
+
+class SectionTree(QWidget):
+    """
+    Filterable tree of sections that emits sectionSelected when a section is chosen
+
+    Args:
+        index (SectionIndex): Sections of the file
+    """
+
+    sectionSelected = pyqtSignal(str)
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.shown_index = index
+        self.sections = None
+        self.current_section = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(5)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter sections...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(lambda _text: self.applyFilter())
+        layout.addWidget(self.filter_input)
+
+        self.tree = QTreeWidget()
+        self.tree.setObjectName("sectionTree")
+        self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
+        self.tree.itemExpanded.connect(self.populateItem)
+        self.tree.currentItemChanged.connect(self.onCurrentItemChanged)
+        layout.addWidget(self.tree, 1)
+
+        self.fillTree()
+
+    def fillTree(self):
+        """Recreate the top level of the tree from the shown index"""
+        self.tree.clear()
+        self.addChildItems(self.tree.invisibleRootItem(), self.shown_index.root)
+
+    def addChildItems(self, parent_item, node):
+        """Create the items of a node's children; their own children are created on expand"""
+        items = []
+        for child in self.shown_index.children(node):
+            item = QTreeWidgetItem([child.label])
+            item.setData(0, NODE_ROLE, child)
+            if child.section is None:
+                # Groups only hold sections
+                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                item.setToolTip(0, f"{child.count} sections")
+            else:
+                item.setToolTip(0, child.section)
+            if child.children:
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+            items.append(item)
+        parent_item.addChildren(items)
+
+    def populateItem(self, item):
+        """Create the children of an item the first time it is expanded"""
+        if item.childCount() == 0:
+            self.addChildItems(item, item.data(0, NODE_ROLE))
+
+    def expandAll(self, parent_item=None):
+        """Expand (and so populate) every item below parent_item"""
+        parent_item = self.tree.invisibleRootItem() if parent_item is None else parent_item
+        for row in range(parent_item.childCount()):
+            item = parent_item.child(row)
+            if item.childIndicatorPolicy() == QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator:
+                self.populateItem(item)
+                item.setExpanded(True)
+                self.expandAll(item)
+
+    def onCurrentItemChanged(self, current, previous):
+        node = current.data(0, NODE_ROLE) if current is not None else None
+        if node is not None and node.section is not None and node.section != self.current_section:
+            self.current_section = node.section
+            self.sectionSelected.emit(node.section)
+
+    def selectSection(self, section):
+        """Expand the tree down to a section and select it; returns False if it isn't shown"""
+        item = None
+        parent_item = self.tree.invisibleRootItem()
+        for node in self.shown_index.path(section):
+            if item is not None:
+                self.populateItem(item)
+                item.setExpanded(True)
+            item = next((parent_item.child(row) for row in range(parent_item.childCount())
+                         if parent_item.child(row).data(0, NODE_ROLE) is node), None)
+            if item is None:
+                return False
+            parent_item = item
+        if item is None:
+            return False
+        self.tree.setCurrentItem(item)
+        self.tree.scrollToItem(item)
+        return True
+
+    def selectFirstSection(self):
+        """Select the first shown section, keeping the current page if there is none"""
+        section = self.shown_index.first_section()
+        if section is not None:
+            self.selectSection(section)
+
+    def setSections(self, sections):
+        """Show only the given sections (e.g. those with search matches), or all if None"""
+        self.sections = sections
+        self.applyFilter()
+
+    def applyFilter(self):
+        """Rebuild the tree for the filter text and the shown sections"""
+        text = self.filter_input.text().strip()
+        if not text and self.sections is None:
+            self.shown_index = self.index
+        else:
+            self.shown_index = self.index.filtered(text, self.sections)
+
+        self.fillTree()
+        if (text or self.sections is not None) and len(self.shown_index) <= AUTO_EXPAND_SECTIONS:
+            self.expandAll()
+
+        # Keep the current section selected while it is shown
+        if self.current_section is not None and self.current_section in self.shown_index:
+            self.selectSection(self.current_section)
+        else:
+            self.selectFirstSection()
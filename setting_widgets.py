@@ -0,0 +1,341 @@
+"""
+Factory for the widgets that edit settings.
+
+The form editor in main.py and the table delegate in settings_table.py both
+create their editors here. The rows of the form editor are kept in an
+EditorPool when a file is closed and bound to the settings of the next file,
+so switching files doesn't create every widget again.
+
+Widgets never get a stylesheet of their own: they are identified by object
+names and dynamic properties, and all of their styling lives in
+styles/dark_style.css, which Qt parses once for the whole application.
+Creating thousands of editors therefore doesn't parse any stylesheet text.
+
+Object names and properties used by the stylesheet:
+
+    #settingLabel        Name label of a setting row
+    #settingEditor       Editor widget of a setting row
+    #resetButton         Reset button of a setting row
+    [description="true"] Description label under an editor
+    [compact="true"]     Row of the compact (Palworld) layout
+
+Descriptions are rendered on demand: every row shows its description as a
+tooltip, and only the row being edited lays it out under its editor.
+Word-wrapped labels are expensive to lay out, so a form with a description
+under every row is slow to build and to resize.
+"""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QCheckBox, QComboBox, QDoubleSpinBox, QLabel, QLineEdit, QSpinBox,
+    QToolButton, QVBoxLayout, QWidget
+)
+
+# Number of decimals shown by float editors
+FLOAT_DECIMALS = 6
+
+# Size of the square reset button, in pixels
+RESET_BUTTON_SIZE = 24
+
+# Setting types with their own editor; other types are edited as text
+EDITOR_KINDS = ('integer', 'float', 'boolean', 'enum', 'string')
+
+# Free rows kept by an EditorPool for each editor kind and layout
+MAX_POOLED_ROWS = 1000
+
+
+def editor_kind(setting_type):
+    """Return the kind of editor used for a setting type (unknown types are edited as text)"""
+    return setting_type if setting_type in EDITOR_KINDS else 'string'
+
+
+def new_editor(kind, parent=None):
+    """Create an unconfigured editor of a kind returned by editor_kind"""
+    if kind == 'integer':
+        editor = QSpinBox(parent)
+        editor.setGroupSeparatorShown(True)
+    elif kind == 'float':
+        editor = QDoubleSpinBox(parent)
+        editor.setDecimals(FLOAT_DECIMALS)
+        editor.setGroupSeparatorShown(True)
+    elif kind == 'boolean':
+        editor = QCheckBox("Enabled", parent)
+    elif kind == 'enum':
+        editor = QComboBox(parent)
+    else:
+        editor = QLineEdit(parent)
+    return editor
+
+
+def configure_editor(editor, setting):
+    """Apply a setting's range or options to an editor created for its type"""
+    setting_type = setting.type
+    if setting_type in ('integer', 'float'):
+        editor.setRange(*setting.value_range())
+    elif setting_type == 'enum':
+        options = setting.options or []
+        if [editor.itemText(index) for index in range(editor.count())] != options:
+            editor.blockSignals(True)
+            editor.clear()
+            editor.addItems(options)
+            editor.blockSignals(False)
+
+
+def create_editor(setting, parent=None):
+    """
+    Create an editor for a setting's type, with its range and options but no value
+
+    Args:
+        setting (SettingDef): Definition of the setting
+        parent (QWidget, optional): Parent widget
+
+    Returns:
+        QWidget: A QSpinBox, QDoubleSpinBox, QCheckBox, QComboBox or QLineEdit
+    """
+    editor = new_editor(editor_kind(setting.type), parent)
+    configure_editor(editor, setting)
+    return editor
+
+
+def set_editor_value(editor, setting_type, value):
+    """
+    Show a value in an editor without emitting its change signals
+
+    Values of the wrong type (e.g. text that couldn't be decoded as a number)
+    leave numeric editors unchanged.
+    """
+    editor.blockSignals(True)
+    try:
+        if setting_type == 'integer':
+            if isinstance(value, int):
+                editor.setValue(value)
+        elif setting_type == 'float':
+            if isinstance(value, (int, float)):
+                editor.setValue(value)
+        elif setting_type == 'boolean':
+            editor.setChecked(value is True)
+        elif setting_type == 'enum':
+            editor.setCurrentText('' if value is None else str(value))
+        else:
+            editor.setText('' if value is None else str(value))
+    finally:
+        editor.blockSignals(False)
+
+
+def editor_value(editor):
+    """Return the value shown in an editor created by create_editor"""
+    if isinstance(editor, (QSpinBox, QDoubleSpinBox)):
+        return editor.value()
+    if isinstance(editor, QCheckBox):
+        return editor.isChecked()
+    if isinstance(editor, QComboBox):
+        return editor.currentText()
+    return editor.text()
+
+
+def connect_editor(editor, callback):
+    """Call callback(value) whenever the user changes the value of an editor"""
+    if isinstance(editor, (QSpinBox, QDoubleSpinBox)):
+        editor.valueChanged.connect(callback)
+    elif isinstance(editor, QCheckBox):
+        editor.stateChanged.connect(lambda state: callback(state == Qt.CheckState.Checked.value))
+    elif isinstance(editor, QComboBox):
+        editor.currentTextChanged.connect(callback)
+    else:
+        editor.textChanged.connect(callback)
+
+
+class SettingRow:
+    """
+    Widgets of a setting in the form editor: label, editor with description, reset button
+
+    Rows are created for an editor kind and bound to a setting; an EditorPool
+    binds a released row to another setting of the same kind instead of
+    creating new widgets. The description label stays hidden and empty until
+    show_description is called.
+
+    Args:
+        kind (str): Editor kind, see editor_kind
+        compact (bool): Use the compact layout
+        reset_icon (QIcon): Icon of the reset button
+    """
+
+    # PyQt keeps weak references to the bound methods connected to signals
+    __slots__ = ('kind', 'compact', 'setting', 'described', 'label', 'container', 'editor',
+                 'description_label', 'reset_button', 'on_change', 'on_reset', '__weakref__')
+
+    def __init__(self, kind, compact, reset_icon):
+        self.kind = kind
+        self.compact = compact
+        self.setting = None
+        self.described = False
+        self.on_change = None
+        self.on_reset = None
+
+        self.label = QLabel()
+        self.label.setObjectName("settingLabel")
+
+        self.container = QWidget()
+        container_layout = QVBoxLayout(self.container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.setSpacing(3 if compact else 4)
+
+        self.editor = new_editor(kind)
+        self.editor.setObjectName("settingEditor")
+        container_layout.addWidget(self.editor)
+
+        self.description_label = QLabel()
+        self.description_label.setWordWrap(True)
+        self.description_label.setProperty("description", True)
+        self.description_label.setVisible(False)
+        container_layout.addWidget(self.description_label)
+
+        self.reset_button = QToolButton()
+        self.reset_button.setObjectName("resetButton")
+        self.reset_button.setIcon(reset_icon)
+        self.reset_button.setFixedSize(RESET_BUTTON_SIZE, RESET_BUTTON_SIZE)
+
+        if compact:
+            for widget in (self.label, self.editor):
+                widget.setProperty("compact", True)
+
+        # The signals are connected once; bind() only replaces the callbacks
+        connect_editor(self.editor, self._changed)
+        self.reset_button.clicked.connect(self._reset)
+
+    @property
+    def widgets(self):
+        """The widgets placed in a form layout: (label, container, reset_button)"""
+        return (self.label, self.container, self.reset_button)
+
+    def bind(self, setting, value, on_change, on_reset, described=True):
+        """
+        Show a setting in the row
+
+        Args:
+            setting (SettingDef): Definition of the setting; its type must match the row's kind
+            value: Current value shown in the editor
+            on_change (callable): Called as on_change(value) when the user edits the value
+            on_reset (callable): Called when the reset button is clicked
+            described (bool): Show the description, see set_described
+        """
+        self.setting = setting
+        self.label.setText(setting.name)
+        configure_editor(self.editor, setting)
+        set_editor_value(self.editor, setting.type, value)
+        self.editor.setProperty("setting", setting.name)
+        self.reset_button.setToolTip(f"Reset to default: {setting.default}")
+        # A reused row may still show the description of its previous setting
+        self._clear_description()
+        self.set_described(described)
+        self.on_change = on_change
+        self.on_reset = on_reset
+
+    def set_described(self, described):
+        """
+        Show or hide the setting's description as the tooltip of the label and editor
+
+        A row that isn't described doesn't generate its description at all and
+        ignores show_description.
+        """
+        self.described = described
+        description = self.setting.description if described else ''
+        self.label.setToolTip(description)
+        self.editor.setToolTip(description)
+        if not described:
+            self.description_label.setVisible(False)
+
+    def show_description(self, shown=True):
+        """Lay out the description under the editor, or hide it again"""
+        description = self.setting.description if shown and self.described else ''
+        if description:
+            self.description_label.setText(description)
+        self.description_label.setVisible(bool(description))
+
+    def unbind(self):
+        """Forget the setting; the widgets stay where they are until added to another form"""
+        self.on_change = None
+        self.on_reset = None
+        self._clear_description()
+
+    def _clear_description(self):
+        self.description_label.setVisible(False)
+        self.description_label.clear()
+
+    def _changed(self, value):
+        if self.on_change is not None:
+            self.on_change(value)
+
+    def _reset(self, checked=False):
+        if self.on_reset is not None:
+            self.on_reset()
+
+
+class EditorPool:
+    """
+    Setting rows kept for reuse, per editor kind
+
+    Switching between files reuses the rows of the previous file instead of
+    creating every widget again. At most max_per_kind rows are kept for each
+    kind and layout.
+
+    Released rows are not taken out of their form: moving a widget to another
+    parent re-polishes it with the application stylesheet, so a reused row is
+    only moved once, into its new form. The pool keeps the detached form of the
+    last released rows alive instead, and deletes it (with the rows that were
+    not reused) when the next rows are released.
+
+    Args:
+        reset_icon (QIcon): Icon of the reset buttons
+        max_per_kind (int): Maximum number of free rows kept per kind and layout
+    """
+
+    def __init__(self, reset_icon, max_per_kind=MAX_POOLED_ROWS):
+        self.reset_icon = reset_icon
+        self.max_per_kind = max_per_kind
+        self._free = {}
+        self._holder = None
+
+    def acquire(self, setting, value, on_change, on_reset, compact=False, described=True):
+        """
+        Return a row bound to a setting, reusing a free row if there is one
+
+        The arguments are those of SettingRow.bind, plus the layout of the row.
+
+        Returns:
+            tuple: (row, reused); the widgets of a reused row are hidden until shown again
+        """
+        kind = editor_kind(setting.type)
+        free = self._free.get((kind, compact))
+        reused = bool(free)
+        row = free.pop() if reused else SettingRow(kind, compact, self.reset_icon)
+        row.bind(setting, value, on_change, on_reset, described)
+        return row, reused
+
+    def release(self, rows, holder):
+        """
+        Keep the rows of a closed form for reuse, up to the pool size
+
+        Rows released earlier and not reused since are deleted.
+
+        Args:
+            rows (iterable): SettingRow objects of the form
+            holder (QWidget): The form, already detached from the window; it
+                owns the rows until they are acquired again
+        """
+        if self._holder is not None:
+            self._holder.deleteLater()
+        self._free = {}
+        for row in rows:
+            row.unbind()
+            free = self._free.setdefault((row.kind, row.compact), [])
+            if len(free) < self.max_per_kind:
+                free.append(row)
+        if self._free:
+            self._holder = holder
+        else:
+            self._holder = None
+            holder.deleteLater()
+
+    def __len__(self):
+        return sum(len(free) for free in self._free.values())
@@ -0,0 +1,199 @@
+"""
+Model/view editor for files with a very large number of settings.
+
+The form editor in main.py creates several widgets per setting, which becomes
+unusable for files with tens of thousands of keys. SettingsTableView shows the
+same settings in a QTableView backed by SettingsTableModel: rows are only
+painted when visible and an editor widget only exists while a cell is being
+edited, so the cost of opening a file no longer grows with its widget count.
+"""
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QStyledItemDelegate, QTableView
+
+from setting_widgets import create_editor, editor_value, set_editor_value
+
+CATEGORY_COLUMN = 0
+NAME_COLUMN = 1
+VALUE_COLUMN = 2
+
+HEADERS = ("Category", "Setting", "Value")
+
+# Row height in pixels; a fixed height lets the view skip measuring rows
+ROW_HEIGHT = 26
+
+INVALID_COLOR = QColor("#e74c3c")
+
+
+class SettingsTableModel(QAbstractTableModel):
+    """
+    Table of settings with their current values
+
+    Args:
+        definitions (SettingDefinitions): Definitions of the rows, in order
+        values (ValueStore): Current values, read on demand
+        on_change (callable): Called as on_change(name, value) when a value is edited
+        validator (Validator, optional): Used to highlight invalid values
+    """
+
+    def __init__(self, definitions, values, on_change, validator=None, parent=None):
+        super().__init__(parent)
+        self.all_settings = list(definitions)
+        self.settings = self.all_settings
+        self.values = values
+        self.on_change = on_change
+        self.validator = validator
+        # Descriptions are shown as tooltips of the rows unless switched off
+        self.show_descriptions = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.settings)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def setting(self, row):
+        """Return the definition shown in a row"""
+        return self.settings[row]
+
+    def showSettings(self, settings=None):
+        """Show only the given settings, in the given order, or all settings if None"""
+        self.beginResetModel()
+        self.settings = self.all_settings if settings is None else list(settings)
+        self.endResetModel()
+
+    def value(self, setting):
+        """Return the current value of a setting, or its default if it has none"""
+        name = setting.name
+        if name in self.values:
+            return self.values[name]
+        return self.values.default(name)
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == VALUE_COLUMN:
+            if self.settings[index.row()].type == 'boolean':
+                flags |= Qt.ItemFlag.ItemIsUserCheckable
+            else:
+                flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        setting = self.settings[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == CATEGORY_COLUMN:
+                return setting.category or ''
+            if column == NAME_COLUMN:
+                return setting.name
+            value = self.value(setting)
+            if setting.type == 'boolean':
+                return "Enabled" if value is True else "Disabled"
+            return '' if value is None else str(value)
+
+        if role == Qt.ItemDataRole.EditRole and column == VALUE_COLUMN:
+            return self.value(setting)
+
+        if role == Qt.ItemDataRole.CheckStateRole and column == VALUE_COLUMN and setting.type == 'boolean':
+            return Qt.CheckState.Checked if self.value(setting) is True else Qt.CheckState.Unchecked
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == VALUE_COLUMN and self.validator and setting.name in self.validator.errors:
+                return self.validator.errors[setting.name]
+            return (setting.description or None) if self.show_descriptions else None
+
+        if role == Qt.ItemDataRole.ForegroundRole and column == VALUE_COLUMN:
+            if self.validator and setting.name in self.validator.errors:
+                return INVALID_COLOR
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != VALUE_COLUMN:
+            return False
+        setting = self.settings[index.row()]
+
+        if role == Qt.ItemDataRole.CheckStateRole:
+            value = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role != Qt.ItemDataRole.EditRole:
+            return False
+
+        self.on_change(setting.name, value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def refresh(self):
+        """Repaint all values, e.g. after they were reset or imported"""
+        if self.settings:
+            self.dataChanged.emit(self.index(0, VALUE_COLUMN),
+                                  self.index(len(self.settings) - 1, VALUE_COLUMN))
+
+
+class SettingDelegate(QStyledItemDelegate):
+    """
+    Creates the editor matching a setting's type when a value cell is edited
+    """
+
+    def createEditor(self, parent, option, index):
+        return create_editor(index.model().setting(index.row()), parent)
+
+    def setEditorData(self, editor, index):
+        setting = index.model().setting(index.row())
+        set_editor_value(editor, setting.type, index.data(Qt.ItemDataRole.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor_value(editor), Qt.ItemDataRole.EditRole)
+
+
+class SettingsTableView(QTableView):
+    """
+    Table view editing all settings of a file, for files too large for the form editor
+    """
+
+    def __init__(self, definitions, values, on_change, validator=None, parent=None):
+        super().__init__(parent)
+        self.settings_model = SettingsTableModel(definitions, values, on_change, validator, self)
+        self.setModel(self.settings_model)
+        self.setItemDelegateForColumn(VALUE_COLUMN, SettingDelegate(self))
+
+        self.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked
+                             | QAbstractItemView.EditTrigger.SelectedClicked
+                             | QAbstractItemView.EditTrigger.EditKeyPressed)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setAlternatingRowColors(True)
+        self.setWordWrap(False)
+
+        # Fixed row heights and column widths avoid measuring every row
+        vertical_header = self.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(ROW_HEIGHT)
+        horizontal_header = self.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        horizontal_header.setStretchLastSection(True)
+        self.setColumnWidth(CATEGORY_COLUMN, 200)
+        self.setColumnWidth(NAME_COLUMN, 320)
+
+        # Styled by the QTableView#settingsTable rules of the application stylesheet
+        self.setObjectName("settingsTable")
+
+    def showSettings(self, settings=None):
+        """Show only the given settings (e.g. search results), or all settings if None"""
+        # Commit and close an open editor first; its row may be filtered out
+        if self.state() == QAbstractItemView.State.EditingState:
+            self.setCurrentIndex(QModelIndex())
+        self.settings_model.showSettings(settings)
+
+    def refresh(self):
+        """Repaint all values, e.g. after they were reset or imported"""
+        self.settings_model.refresh()